@@ -0,0 +1,2 @@
+"""Utils package."""
+from .graph_layout import spring_layout, graph_fingerprint
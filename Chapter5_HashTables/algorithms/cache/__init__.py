@@ -0,0 +1,6 @@
+"""Cache algorithm package."""
+from .logic import CacheEvent, CacheStats, LRUCache, LFUCache
+from .simulator import (
+    POLICY_NAMES, StackDistanceCounter, FIFOPolicy, ClockPolicy, ARCPolicy,
+    ReplayResult, make_policy, read_requests, replay
+)
@@ -0,0 +1,268 @@
+"""
+Pure cache logic: LRU and LFU eviction on top of a hash map.
+No Manim imports.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from collections import deque
+from dataclasses import dataclass
+import time
+
+from ..hash_table.logic import DEFAULT_TRACE_LIMIT
+
+
+@dataclass
+class CacheEvent:
+    """Represents a cache operation (for replay traces and animation)."""
+    operation: str    # "get", "put", "evict", "expire", "delete"
+    key: str
+    value: Any
+    hit: bool
+    size: int         # Entries after the operation
+    time: float
+
+
+@dataclass
+class CacheStats:
+    """Running counters."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+class _Node:
+    """Entry that is also its own linked-list link (intrusive list)."""
+    __slots__ = ("key", "value", "expires", "freq", "prev", "next")
+
+    def __init__(self, key=None, value=None, expires=None):
+        self.key = key
+        self.value = value
+        self.expires = expires
+        self.freq = 1
+        self.prev = self
+        self.next = self
+
+
+class _DList:
+    """Circular doubly linked list with a sentinel; O(1) push/unlink."""
+    __slots__ = ("head", "size")
+
+    def __init__(self):
+        self.head = _Node()
+        self.size = 0
+
+    def push_front(self, node: _Node):
+        node.prev, node.next = self.head, self.head.next
+        self.head.next.prev = node
+        self.head.next = node
+        self.size += 1
+
+    def unlink(self, node: _Node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = node
+        self.size -= 1
+
+    def back(self) -> Optional[_Node]:
+        return None if self.size == 0 else self.head.prev
+
+    def __iter__(self) -> Iterator[_Node]:
+        node = self.head.next
+        while node is not self.head:
+            yield node
+            node = node.next
+
+
+class LRUCache:
+    """
+    Least-recently-used cache: dict for lookup, intrusive list for recency.
+    get/put/delete are O(1).
+
+    ttl (seconds) applies to every entry unless put() overrides it; expired
+    entries count as misses and are dropped when next touched or when they
+    reach the eviction end of the list. `clock` can be swapped for log
+    timestamps when replaying recorded traffic.
+
+    With trace=True the last `trace_limit` CacheEvents are kept in
+    `events`, a deque ring buffer (trace_limit=None keeps them all).
+    """
+
+    def __init__(self, capacity: int = 128, ttl: Optional[float] = None,
+                 trace: bool = False, clock: Callable[[], float] = time.monotonic,
+                 trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self.trace = trace
+        self.events = deque(maxlen=trace_limit)  # Recent CacheEvents for replay and animation
+        self._map: Dict[str, _Node] = {}
+        self._order = _DList()   # Front = most recently used
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key) -> bool:
+        node = self._map.get(key)
+        return node is not None and not self._expired(node, self.clock())
+
+    def keys(self) -> List[str]:
+        """Keys from most to least recently used (animation order)."""
+        return [node.key for node in self._order]
+
+    def _record(self, operation: str, key, value, hit: bool, now: float):
+        if self.trace:
+            self.events.append(CacheEvent(operation, key, value, hit, len(self._map), now))
+
+    @staticmethod
+    def _expired(node: _Node, now: float) -> bool:
+        return node.expires is not None and now >= node.expires
+
+    # Policy hooks, overridden by LFUCache
+    def _touch(self, node: _Node):
+        self._order.unlink(node)
+        self._order.push_front(node)
+
+    def _link(self, node: _Node):
+        self._order.push_front(node)
+
+    def _unlink(self, node: _Node):
+        self._order.unlink(node)
+
+    def _victim(self) -> _Node:
+        return self._order.back()
+
+    def _drop(self, node: _Node):
+        del self._map[node.key]
+        self._unlink(node)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or `default` on a miss."""
+        now = self.clock()
+        node = self._map.get(key)
+        if node is not None and self._expired(node, now):
+            self._drop(node)
+            self.stats.expirations += 1
+            self._record("expire", key, node.value, False, now)
+            node = None
+        if node is None:
+            self.stats.misses += 1
+            self._record("get", key, None, False, now)
+            return default
+        self._touch(node)
+        self.stats.hits += 1
+        self._record("get", key, node.value, True, now)
+        return node.value
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Insert or overwrite, evicting one entry when full."""
+        now = self.clock()
+        ttl = self.ttl if ttl is None else ttl
+        expires = now + ttl if ttl is not None else None
+        node = self._map.get(key)
+        if node is not None:
+            node.value, node.expires = value, expires
+            self._touch(node)
+            self._record("put", key, value, True, now)
+            return
+
+        if len(self._map) >= self.capacity:
+            victim = self._victim()
+            self._drop(victim)
+            if self._expired(victim, now):
+                self.stats.expirations += 1
+                self._record("expire", victim.key, victim.value, False, now)
+            else:
+                self.stats.evictions += 1
+                self._record("evict", victim.key, victim.value, False, now)
+
+        node = _Node(key, value, expires)
+        self._map[key] = node
+        self._link(node)
+        self._record("put", key, value, False, now)
+
+    def delete(self, key: str) -> bool:
+        """Remove a key; returns whether it was present."""
+        node = self._map.get(key)
+        if node is None:
+            return False
+        self._drop(node)
+        self._record("delete", key, node.value, True, self.clock())
+        return True
+
+    def clear(self):
+        for node in list(self._map.values()):
+            self._drop(node)
+
+
+class LFUCache(LRUCache):
+    """
+    Least-frequently-used cache, ties broken by recency. get/put are O(1):
+    one recency list per access count plus the smallest live count.
+
+    _touch raises the smallest count when it empties that list, and a new
+    key resets it to 1. A delete or expiry can leave it pointing at an
+    empty count; the next eviction then looks it up once.
+    """
+
+    def __init__(self, capacity: int = 128, ttl: Optional[float] = None,
+                 trace: bool = False, clock: Callable[[], float] = time.monotonic,
+                 trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
+        super().__init__(capacity, ttl, trace, clock, trace_limit)
+        self._buckets: Dict[int, _DList] = {}
+        self._min_freq = 0
+
+    def keys(self) -> List[str]:
+        """Keys from most to least frequently used."""
+        return [node.key for freq in sorted(self._buckets, reverse=True)
+                for node in self._buckets[freq]]
+
+    def frequency(self, key: str) -> int:
+        node = self._map.get(key)
+        return node.freq if node is not None else 0
+
+    def _bucket(self, freq: int) -> _DList:
+        bucket = self._buckets.get(freq)
+        if bucket is None:
+            bucket = self._buckets[freq] = _DList()
+        return bucket
+
+    def _unlink(self, node: _Node):
+        bucket = self._buckets[node.freq]
+        bucket.unlink(node)
+        if bucket.size == 0:
+            del self._buckets[node.freq]
+
+    def _link(self, node: _Node):
+        node.freq = 1
+        self._bucket(1).push_front(node)
+        self._min_freq = 1
+
+    def _touch(self, node: _Node):
+        old = node.freq
+        bucket = self._buckets[old]
+        bucket.unlink(node)
+        if bucket.size == 0:
+            del self._buckets[old]
+            if self._min_freq == old:
+                self._min_freq = old + 1
+        node.freq = old + 1
+        self._bucket(node.freq).push_front(node)
+
+    def _victim(self) -> _Node:
+        bucket = self._buckets.get(self._min_freq)
+        if bucket is None:
+            # Only after a delete or expiry emptied the smallest count
+            self._min_freq = min(self._buckets)
+            bucket = self._buckets[self._min_freq]
+        return bucket.back()
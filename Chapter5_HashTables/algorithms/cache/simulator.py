@@ -0,0 +1,296 @@
+"""
+Replay request logs through several eviction policies in one pass.
+LRU curves for every capacity come from Mattson stack distances; the other
+policies are simulated side by side at the requested capacities.
+No Manim imports.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .logic import LRUCache, LFUCache
+
+
+POLICY_NAMES = ("lru", "lfu", "fifo", "clock", "arc")
+
+
+def read_requests(path) -> Iterator[str]:
+    """Stream a request log, one key per line (blank lines skipped)."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            key = line.strip()
+            if key:
+                yield key
+
+
+class StackDistanceCounter:
+    """
+    LRU stack distance of every request: how many distinct keys were touched
+    since the previous access to the same key. An LRU cache of capacity c
+    hits exactly the requests with distance < c.
+
+    A Fenwick tree over access times marks each key's latest access, so a
+    distance is one prefix-sum difference. Times are renumbered once the
+    tree fills, keeping memory proportional to the distinct keys.
+    """
+
+    def __init__(self, initial_size: int = 1 << 16):
+        self.initial_size = initial_size
+        self.histogram: List[int] = []   # histogram[d] = requests at distance d
+        self.cold = 0                    # First-time requests (infinite distance)
+        self.requests = 0
+        self._last: Dict[str, int] = {}
+        self._tree = [0] * (initial_size + 1)
+        self._time = 0
+
+    def _add(self, i: int, delta: int):
+        tree, i = self._tree, i + 1
+        n = len(tree)
+        while i < n:
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i: int) -> int:
+        """Live marks at times 0..i-1."""
+        tree, total = self._tree, 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _renumber(self):
+        keys = sorted(self._last, key=self._last.__getitem__)
+        size = max(2 * len(keys), self.initial_size)
+        self._last = {key: t for t, key in enumerate(keys)}
+        # Linear Fenwick build over len(keys) leading ones
+        tree = [0] * (size + 1)
+        for i in range(1, size + 1):
+            if i <= len(keys):
+                tree[i] += 1
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._time = len(keys)
+
+    def access(self, key: str) -> Optional[int]:
+        """Record one request; returns its stack distance (None if cold)."""
+        if self._time >= len(self._tree) - 1:
+            self._renumber()
+        self.requests += 1
+        last = self._last.get(key)
+        if last is None:
+            self.cold += 1
+            distance = None
+        else:
+            distance = self._prefix(self._time) - self._prefix(last + 1)
+            self._add(last, -1)
+            if distance >= len(self.histogram):
+                self.histogram.extend([0] * (distance + 1 - len(self.histogram)))
+            self.histogram[distance] += 1
+        self._add(self._time, 1)
+        self._last[key] = self._time
+        self._time += 1
+        return distance
+
+    def hit_ratios(self, capacities: Sequence[int]) -> np.ndarray:
+        """LRU hit ratio for each capacity, all from the same histogram."""
+        hits = np.concatenate([[0], np.cumsum(self.histogram, dtype=np.int64)])
+        caps = np.minimum(np.asarray(capacities, dtype=np.int64), len(self.histogram))
+        return hits[caps] / max(self.requests, 1)
+
+
+class _EnginePolicy:
+    """Adapter that replays through the LRU/LFU cache engine."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def access(self, key: str) -> bool:
+        if self.cache.get(key) is not None:
+            return True
+        self.cache.put(key, True)
+        return False
+
+
+class FIFOPolicy:
+    """Evict in insertion order; hits do not refresh anything."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._queue = deque()
+        self._keys = set()
+
+    def access(self, key: str) -> bool:
+        if key in self._keys:
+            return True
+        if len(self._keys) >= self.capacity:
+            self._keys.discard(self._queue.popleft())
+        self._queue.append(key)
+        self._keys.add(key)
+        return False
+
+
+class ClockPolicy:
+    """Second-chance FIFO: a hand sweeps slots, clearing reference bits."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._slots: List[Optional[str]] = [None] * capacity
+        self._ref = bytearray(capacity)
+        self._where: Dict[str, int] = {}
+        self._hand = 0
+
+    def access(self, key: str) -> bool:
+        slot = self._where.get(key)
+        if slot is not None:
+            self._ref[slot] = 1
+            return True
+        while self._ref[self._hand]:
+            self._ref[self._hand] = 0
+            self._hand = (self._hand + 1) % self.capacity
+        old = self._slots[self._hand]
+        if old is not None:
+            del self._where[old]
+        self._slots[self._hand] = key
+        self._where[key] = self._hand
+        self._hand = (self._hand + 1) % self.capacity
+        return False
+
+
+class ARCPolicy:
+    """
+    Adaptive Replacement Cache (Megiddo & Modha). T1/T2 hold recent and
+    frequent keys, B1/B2 remember their evictions, and `p` shifts space
+    toward whichever ghost list keeps getting hit.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.p = 0
+        self.t1, self.t2 = OrderedDict(), OrderedDict()
+        self.b1, self.b2 = OrderedDict(), OrderedDict()
+
+    def _replace(self, in_b2: bool):
+        if self.t1 and (len(self.t1) > self.p or (in_b2 and len(self.t1) == self.p)):
+            old, _ = self.t1.popitem(last=False)
+            self.b1[old] = None
+        else:
+            old, _ = self.t2.popitem(last=False)
+            self.b2[old] = None
+
+    def access(self, key: str) -> bool:
+        c = self.capacity
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+            return True
+        if key in self.t2:
+            self.t2.move_to_end(key)
+            return True
+
+        if key in self.b1:
+            self.p = min(c, self.p + max(len(self.b2) // len(self.b1), 1))
+            self._replace(False)
+            del self.b1[key]
+            self.t2[key] = None
+            return False
+        if key in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            self._replace(True)
+            del self.b2[key]
+            self.t2[key] = None
+            return False
+
+        l1 = len(self.t1) + len(self.b1)
+        total = l1 + len(self.t2) + len(self.b2)
+        if l1 == c:
+            if len(self.t1) < c:
+                self.b1.popitem(last=False)
+                self._replace(False)
+            else:
+                self.t1.popitem(last=False)
+        elif l1 < c and total >= c:
+            if total == 2 * c:
+                self.b2.popitem(last=False)
+            self._replace(False)
+        self.t1[key] = None
+        return False
+
+
+def make_policy(name: str, capacity: int):
+    """Build a hit/miss simulator for one policy and capacity."""
+    if name == "lru":
+        return _EnginePolicy(LRUCache(capacity, clock=float))
+    if name == "lfu":
+        return _EnginePolicy(LFUCache(capacity, clock=float))
+    if name == "fifo":
+        return FIFOPolicy(capacity)
+    if name == "clock":
+        return ClockPolicy(capacity)
+    if name == "arc":
+        return ARCPolicy(capacity)
+    raise ValueError(f"Unknown policy: {name!r}")
+
+
+@dataclass
+class ReplayResult:
+    """Hit-ratio curves of one replay."""
+    requests: int
+    unique_keys: int
+    capacities: np.ndarray
+    hit_ratios: Dict[str, np.ndarray] = field(default_factory=dict)
+    stack: Optional[StackDistanceCounter] = None
+
+    def lru_curve(self, capacities: Sequence[int]) -> np.ndarray:
+        """Exact LRU hit ratios at any other capacities, no second replay."""
+        return self.stack.hit_ratios(capacities)
+
+
+def replay(
+    requests: Iterable[str],
+    capacities: Sequence[int],
+    policies: Sequence[str] = POLICY_NAMES
+) -> ReplayResult:
+    """
+    Stream requests once through every policy.
+
+    Args:
+        requests: Keys in request order (e.g. read_requests(path))
+        capacities: Cache sizes to report
+        policies: Names from POLICY_NAMES; "lru" uses stack distances, so
+                  its curve is exact for every capacity at no extra cost
+
+    Returns:
+        ReplayResult with one hit-ratio array per policy
+    """
+    capacities = np.asarray(sorted(set(int(c) for c in capacities)), dtype=np.int64)
+    if len(capacities) and capacities[0] < 1:
+        raise ValueError("capacities must be at least 1")
+    stack = StackDistanceCounter()
+    simulated = [name for name in policies if name != "lru"]
+    sims = [[make_policy(name, int(c)) for c in capacities] for name in simulated]
+    hits = np.zeros((len(simulated), len(capacities)), dtype=np.int64)
+
+    for key in requests:
+        stack.access(key)
+        for row, policy_sims in enumerate(sims):
+            for col, sim in enumerate(policy_sims):
+                if sim.access(key):
+                    hits[row, col] += 1
+
+    result = ReplayResult(
+        requests=stack.requests,
+        unique_keys=stack.cold,
+        capacities=capacities,
+        stack=stack
+    )
+    total = max(stack.requests, 1)
+    for name in policies:
+        if name == "lru":
+            result.hit_ratios[name] = stack.hit_ratios(capacities)
+        else:
+            result.hit_ratios[name] = hits[simulated.index(name)] / total
+    return result
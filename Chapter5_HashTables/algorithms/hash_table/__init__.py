@@ -1,5 +1,29 @@
 """Hash table algorithm package."""
 from .logic import (
-    simple_hash, first_letter_hash, SimpleHashTable, HashOperation,
+    simple_hash, first_letter_hash, fnv1a_hash, multiply_shift_hash, hash64,
+    SimpleHashTable, HashOperation,
     GROCERY_ITEMS, PHONE_BOOK, VOTERS, HASH_TABLE_COMPLEXITY
 )
+from .open_addressing import LinearProbingHashTable, RobinHoodHashTable
+from .cuckoo import CuckooHashTable, CUCKOO_COMPLEXITY
+from .swiss import SwissHashTable
+from .compact import CompactHashTable
+from .concurrent import StripedHashTable, LockedHashTable
+from .mapped import MappedHashTable
+from .benchmark import lookup_benchmark, memory_benchmark, concurrent_benchmark, gil_enabled
+from .sketches import (
+    hash_pair, batch_hash_pair, bloom_parameters, BloomFilter, CountMinSketch,
+    HyperLogLog
+)
+from .perfect import MinimalPerfectHash, PerfectHashTable
+from .consistent import (
+    ConsistentHashRing, BoundedLoadRing, key_movement, load_spread, rebalance_cost
+)
+from .batch_hash import (
+    encode_keys, batch_simple_hash, batch_first_letter_hash,
+    batch_fnv1a_hash, batch_multiply_shift_hash, batch_hash64, bucket_histogram
+)
+from .analysis import (
+    HASH_FUNCTIONS, HashQualityReport, analyze_hashes, collision_curve,
+    avalanche_matrix, avalanche_bias
+)
@@ -0,0 +1,183 @@
+"""
+Hash function quality measurements over a key corpus.
+Uniformity, collisions, chaining lookup cost and avalanche bias.
+No Manim imports.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .batch_hash import (
+    batch_simple_hash, batch_first_letter_hash,
+    batch_fnv1a_hash, batch_multiply_shift_hash, bucket_histogram
+)
+
+
+# Batch hash functions compared by default: (keys, table_size) -> indices
+HASH_FUNCTIONS: Dict[str, Callable[..., np.ndarray]] = {
+    "simple": batch_simple_hash,
+    "first_letter": batch_first_letter_hash,
+    "fnv1a": batch_fnv1a_hash,
+    "multiply_shift": batch_multiply_shift_hash,
+}
+
+# Output width used for avalanche tests (all functions above fit in 32 bits)
+AVALANCHE_BITS = 32
+
+
+@dataclass
+class HashQualityReport:
+    """One hash function on one table size."""
+    function: str
+    table_size: int
+    keys: int
+    chi_square: float            # Against a uniform spread
+    chi_square_ratio: float      # chi_square / (table_size - 1); ~1 is uniform
+    occupancy_variance: float    # Variance of items per bucket
+    expected_collisions: float   # Keys landing in an occupied bucket, uniform hash
+    observed_collisions: int
+    mean_probes: float           # Chain entries read per successful lookup
+    expected_probes: float       # Same, uniform hash: 1 + (n - 1) / 2m
+    max_chain: int
+
+
+def chi_square(counts: np.ndarray) -> float:
+    """Pearson chi-square of bucket counts against a uniform spread."""
+    expected = counts.sum() / len(counts)
+    if expected == 0:
+        return 0.0
+    return float(((counts - expected) ** 2).sum() / expected)
+
+
+def expected_collisions(n: int, m: int) -> float:
+    """Keys that land in an already occupied bucket if hashing is uniform."""
+    return n - m * (1.0 - (1.0 - 1.0 / m) ** n)
+
+
+def mean_probes(counts: np.ndarray) -> float:
+    """Average chain position of a key, i.e. successful lookup cost."""
+    n = counts.sum()
+    if n == 0:
+        return 0.0
+    return float((counts * (counts + 1) / 2).sum() / n)
+
+
+def bucket_report(name: str, counts: np.ndarray) -> HashQualityReport:
+    """All per-table-size measurements from one bucket histogram."""
+    n, m = int(counts.sum()), len(counts)
+    chi2 = chi_square(counts)
+    return HashQualityReport(
+        function=name,
+        table_size=m,
+        keys=n,
+        chi_square=chi2,
+        chi_square_ratio=chi2 / max(m - 1, 1),
+        occupancy_variance=float(counts.var()),
+        expected_collisions=expected_collisions(n, m),
+        observed_collisions=n - int(np.count_nonzero(counts)),
+        mean_probes=mean_probes(counts),
+        expected_probes=1.0 + (n - 1) / (2.0 * m) if n else 0.0,
+        max_chain=int(counts.max()) if m else 0,
+    )
+
+
+def collision_curve(
+    keys: Iterable[str],
+    table_sizes: Sequence[int],
+    hash_fn: Callable[..., np.ndarray] = batch_simple_hash
+) -> Dict[str, np.ndarray]:
+    """
+    Observed vs expected collisions as the table grows.
+
+    Returns:
+        {"table_size", "observed", "expected", "mean_probes"} arrays
+    """
+    keys = list(dict.fromkeys(keys))
+    rows = [bucket_report("", bucket_histogram(hash_fn(keys, m), m)) for m in table_sizes]
+    return {
+        "table_size": np.asarray(table_sizes),
+        "observed": np.array([r.observed_collisions for r in rows]),
+        "expected": np.array([r.expected_collisions for r in rows]),
+        "mean_probes": np.array([r.mean_probes for r in rows]),
+    }
+
+
+def avalanche_matrix(
+    keys: Sequence[str],
+    hash_fn: Callable[..., np.ndarray],
+    samples: int = 2000,
+    seed: int = 0
+) -> np.ndarray:
+    """
+    Flip one low bit of one character per sample and record which output
+    bits change.
+
+    Returns:
+        (7, AVALANCHE_BITS) matrix: P(output bit j flips | input bit i flipped).
+        An ideal hash reads 0.5 everywhere.
+    """
+    rng = np.random.default_rng(seed)
+    keys = [k for k in keys if k]
+    before, after, flipped_bits = [], [], []
+    if keys:
+        for idx in rng.integers(len(keys), size=samples):
+            key = keys[idx]
+            pos = int(rng.integers(len(key)))
+            bit = int(rng.integers(7))
+            c = chr(ord(key[pos]) ^ (1 << bit))
+            if c == "\0":
+                continue
+            before.append(key)
+            after.append(key[:pos] + c + key[pos + 1:])
+            flipped_bits.append(bit)
+
+    matrix = np.zeros((7, AVALANCHE_BITS))
+    if not before:
+        return matrix
+    size = 1 << AVALANCHE_BITS
+    diff = (hash_fn(before, size) ^ hash_fn(after, size)).astype(np.uint64)
+    out = (diff[:, None] >> np.arange(AVALANCHE_BITS, dtype=np.uint64)) & np.uint64(1)
+    flipped_bits = np.array(flipped_bits)
+    for bit in range(7):
+        rows = flipped_bits == bit
+        if rows.any():
+            matrix[bit] = out[rows].mean(axis=0)
+    return matrix
+
+
+def avalanche_bias(matrix: np.ndarray) -> float:
+    """0 for a perfect avalanche, 1 when output bits never (or always) flip."""
+    return float(np.abs(matrix - 0.5).mean() * 2)
+
+
+def analyze_hashes(
+    keys: Iterable[str],
+    table_sizes: Sequence[int] = (10, 97, 1024, 4099),
+    functions: Optional[Dict[str, Callable[..., np.ndarray]]] = None,
+    avalanche_samples: int = 2000,
+    seed: int = 0
+) -> Dict[str, object]:
+    """
+    Compare hash functions on one corpus.
+
+    Args:
+        keys: Key corpus; duplicates are dropped so only real collisions count
+        table_sizes: Bucket counts to evaluate
+        functions: {name: batch hash}, defaults to HASH_FUNCTIONS
+        avalanche_samples: Single-bit flips per function
+        seed: Seed for the avalanche samples
+
+    Returns:
+        {"reports": [HashQualityReport], "avalanche": {name: bias}}
+    """
+    keys = list(dict.fromkeys(keys))
+    functions = functions or HASH_FUNCTIONS
+    reports: List[HashQualityReport] = []
+    avalanche: Dict[str, float] = {}
+    for name, fn in functions.items():
+        for m in table_sizes:
+            reports.append(bucket_report(name, bucket_histogram(fn(keys, m), m)))
+        matrix = avalanche_matrix(keys, fn, samples=avalanche_samples, seed=seed)
+        avalanche[name] = avalanche_bias(matrix)
+    return {"reports": reports, "avalanche": avalanche}
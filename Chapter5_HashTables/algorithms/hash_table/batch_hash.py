@@ -0,0 +1,170 @@
+"""
+Vectorized versions of the Chapter 5 hash functions for large key corpora.
+No Manim imports.
+"""
+from typing import Iterable, Iterator
+from itertools import islice
+
+import numpy as np
+
+from .logic import (
+    FNV_OFFSET, FNV_PRIME, GOLDEN_GAMMA, FNV64_OFFSET, FNV64_PRIME, FMIX64_C1, FMIX64_C2
+)
+
+
+DEFAULT_CHUNK = 1_000_000
+# Padded cells (keys x longest key) per chunk: 256 MB as uint32 code points
+MAX_CHUNK_CELLS = 1 << 26
+# Padded cells allowed per character actually present
+PADDING_SLACK = 4
+
+
+def encode_keys(keys) -> np.ndarray:
+    """
+    Keys as a zero-padded (n, max_len) matrix of Unicode code points,
+    so sum(ord(c)) becomes a row sum. Every row is as wide as the longest
+    key; the batch functions feed it chunks from _chunks to bound that.
+    """
+    arr = np.ascontiguousarray(np.asarray(keys, dtype=str))
+    return arr.view(np.uint32).reshape(len(arr), arr.dtype.itemsize // 4)
+
+
+def _split_padded(keys: list, max_cells: int) -> Iterator[list]:
+    """Cut a run of keys wherever padding would outgrow the characters present."""
+    chunk, width, used = [], 0, 0
+    for key in keys:
+        wider = max(width, len(key))
+        cells = (len(chunk) + 1) * wider
+        if chunk and (cells > max_cells or cells > PADDING_SLACK * (used + len(key)) + 4096):
+            yield chunk
+            chunk, wider, used = [], len(key), 0
+        chunk.append(key)
+        width = wider
+        used += len(key)
+    if chunk:
+        yield chunk
+
+
+def _chunks(keys: Iterable[str], chunk_size: int,
+            max_cells: int = MAX_CHUNK_CELLS) -> Iterator[list]:
+    """
+    Runs of at most chunk_size keys whose padded matrix (keys x longest
+    key) stays within max_cells and within a few times the characters
+    actually present, so one very long key only widens the handful of
+    keys chunked with it.
+    """
+    it = iter(keys)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk))
+        cells = len(chunk) * int(lengths.max())
+        if cells <= max_cells and cells <= PADDING_SLACK * int(lengths.sum()) + 4096:
+            yield chunk
+        else:
+            yield from _split_padded(chunk, max_cells)
+
+
+def _ascii_upper(codes: np.ndarray) -> np.ndarray:
+    # Unsigned wrap-around makes this a single comparison for 'A'..'Z'
+    return (codes - np.uint32(ord('A'))) < 26
+
+
+def batch_simple_hash(keys: Iterable[str], table_size: int = 10,
+                      chunk_size: int = DEFAULT_CHUNK) -> np.ndarray:
+    """simple_hash for many keys at once; returns int64 bucket indices."""
+    parts = []
+    for chunk in _chunks(keys, chunk_size):
+        codes = encode_keys(chunk)
+        # lower() on ASCII just adds 32 per uppercase letter
+        sums = codes.sum(axis=1, dtype=np.int64) + 32 * _ascii_upper(codes).sum(axis=1)
+        # Rare non-ASCII keys take the exact str.lower() path
+        for i in np.flatnonzero((codes >= 128).any(axis=1)):
+            sums[i] = sum(ord(c) for c in chunk[i].lower())
+        parts.append(sums % table_size)
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def batch_first_letter_hash(keys: Iterable[str], table_size: int = 26,
+                            chunk_size: int = DEFAULT_CHUNK) -> np.ndarray:
+    """first_letter_hash for many keys at once; empty keys map to 0."""
+    parts = []
+    for chunk in _chunks(keys, chunk_size):
+        first = encode_keys(chunk)[:, 0]
+        lowered = first.astype(np.int64) + 32 * _ascii_upper(first)
+        for i in np.flatnonzero(first >= 128):
+            lowered[i] = ord(chunk[i][0].lower())
+        parts.append(np.where(first == 0, 0, (lowered - ord('a')) % table_size))
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def _utf8_keys(chunk: list):
+    """UTF-8 bytes as a zero-padded uint8 matrix plus per-key byte lengths."""
+    raw = [k.encode("utf-8") for k in chunk]
+    encoded = np.array(raw, dtype=bytes)
+    width = max(encoded.dtype.itemsize, 1)
+    data = np.ascontiguousarray(encoded).view(np.uint8).reshape(len(chunk), width)
+    return data, np.fromiter(map(len, raw), dtype=np.int64, count=len(raw))
+
+
+def batch_fnv1a_hash(keys: Iterable[str], table_size: int = 10,
+                     chunk_size: int = DEFAULT_CHUNK) -> np.ndarray:
+    """fnv1a_hash for many keys at once, one byte column per step."""
+    parts = []
+    for chunk in _chunks(keys, chunk_size):
+        data, lengths = _utf8_keys(chunk)
+        h = np.full(len(chunk), FNV_OFFSET, dtype=np.uint32)
+        for col in range(data.shape[1]):
+            live = lengths > col
+            # uint32 multiplication wraps, which is exactly the & MASK32
+            stepped = (h ^ data[:, col]) * np.uint32(FNV_PRIME)
+            h = np.where(live, stepped, h)
+        parts.append(h.astype(np.int64) % table_size)
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def batch_multiply_shift_hash(keys: Iterable[str], table_size: int = 10,
+                              chunk_size: int = DEFAULT_CHUNK) -> np.ndarray:
+    """multiply_shift_hash for many keys at once."""
+    parts = []
+    for chunk in _chunks(keys, chunk_size):
+        codes = encode_keys(chunk).astype(np.uint64)
+        lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk))
+        h = np.zeros(len(chunk), dtype=np.uint64)
+        for col in range(codes.shape[1]):
+            stepped = h * np.uint64(31) + codes[:, col]
+            h = np.where(lengths > col, stepped, h)
+        h = (h * np.uint64(GOLDEN_GAMMA)) >> np.uint64(32)
+        parts.append(h.astype(np.int64) % table_size)
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def batch_fmix64(h: np.ndarray) -> np.ndarray:
+    """fmix64 over a uint64 array (multiplication wraps like & MASK64)."""
+    shift = np.uint64(33)
+    h = h ^ (h >> shift)
+    h = h * np.uint64(FMIX64_C1)
+    h ^= h >> shift
+    h = h * np.uint64(FMIX64_C2)
+    return h ^ (h >> shift)
+
+
+def batch_hash64(keys: Iterable[str], table_size: int = 1 << 64,
+                 chunk_size: int = DEFAULT_CHUNK) -> np.ndarray:
+    """hash64 for many keys at once; returns uint64."""
+    parts = []
+    for chunk in _chunks(keys, chunk_size):
+        data, lengths = _utf8_keys(chunk)
+        h = np.full(len(chunk), FNV64_OFFSET, dtype=np.uint64)
+        for col in range(data.shape[1]):
+            stepped = (h ^ data[:, col]) * np.uint64(FNV64_PRIME)
+            h = np.where(lengths > col, stepped, h)
+        h = batch_fmix64(h)
+        parts.append(h % np.uint64(table_size) if table_size < 1 << 64 else h)
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.uint64)
+
+
+def bucket_histogram(indices: np.ndarray, table_size: int) -> np.ndarray:
+    """Items per bucket, the same shape of data as get_distribution()."""
+    return np.bincount(indices, minlength=table_size)
@@ -0,0 +1,178 @@
+"""
+Benchmarks comparing the hash table implementations.
+No Manim imports.
+"""
+from typing import Callable, Dict, List, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from .logic import SimpleHashTable, fnv1a_hash
+from .swiss import SwissHashTable, GROUP_WIDTH
+from .concurrent import StripedHashTable, LockedHashTable
+from .compact import CompactHashTable
+
+
+def _best_of(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def lookup_benchmark(
+    load_factors: Sequence[float] = (0.5, 0.75, 0.875),
+    groups: int = 4096,
+    lookups: int = 100_000,
+    hit_ratio: float = 0.9,
+    repeats: int = 3,
+    seed: int = 0
+) -> List[Dict[str, float]]:
+    """
+    Lookup-heavy workload: fill each table to the same load factor, then
+    time `lookups` gets, `hit_ratio` of them for present keys.
+
+    Both tables use fnv1a_hash and the same slot count, so the difference
+    is the layout: chains of tuples vs grouped control bytes.
+
+    Returns:
+        One row per load factor with ns per lookup for
+        chaining get(), Swiss get() and Swiss lookup_many()
+    """
+    rng = random.Random(seed)
+    slots = groups * GROUP_WIDTH
+    rows = []
+    for load in load_factors:
+        n = int(load * slots)
+        keys = [f"key-{i}" for i in range(n)]
+        queries = [rng.choice(keys) if rng.random() < hit_ratio else f"miss-{i}"
+                   for i in range(lookups)]
+
+        chained = SimpleHashTable(size=slots, hash_fn=fnv1a_hash)
+        swiss = SwissHashTable(size=slots, max_load=max(load, 0.875))
+        for i, key in enumerate(keys):
+            chained.put(key, i)
+            swiss.put(key, i)
+
+        chained_get, swiss_get = chained.get, swiss.get
+        t_chained = _best_of(lambda: [chained_get(k) for k in queries], repeats)
+        t_swiss = _best_of(lambda: [swiss_get(k) for k in queries], repeats)
+        t_batch = _best_of(lambda: swiss.lookup_many(queries), repeats)
+        rows.append({
+            "load_factor": swiss.load_factor(),
+            "chaining_ns": t_chained / lookups * 1e9,
+            "swiss_ns": t_swiss / lookups * 1e9,
+            "swiss_batch_ns": t_batch / lookups * 1e9,
+        })
+    return rows
+
+
+def memory_benchmark(entries: Sequence[int] = (10_000, 100_000, 1_000_000),
+                     load: float = 0.75) -> List[Dict[str, float]]:
+    """
+    Bytes per entry allocated by each chained table, measured with
+    tracemalloc. Keys and values are created beforehand, so only the
+    table's own structures are counted.
+
+    Returns:
+        One row per entry count with simple_bytes and compact_bytes per entry
+    """
+    rows = []
+    for n in entries:
+        keys = [f"key-{i}" for i in range(n)]
+        values = list(range(n))
+        size = int(n / load)
+        row = {"entries": n}
+        for name, factory in (
+            ("simple", lambda: SimpleHashTable(size=size, hash_fn=fnv1a_hash)),
+            ("compact", lambda: CompactHashTable(size=size, auto_resize=False)),
+        ):
+            tracemalloc.start()
+            table = factory()
+            for key, value in zip(keys, values):
+                table.put(key, value)
+            used = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            row[f"{name}_bytes"] = used / n
+            del table
+        rows.append(row)
+    return rows
+
+
+def gil_enabled() -> bool:
+    """False on free-threaded (PEP 703) builds running without the GIL."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def _worker(table, ops: List[tuple], barrier: threading.Barrier) -> float:
+    get, put = table.get, table.put
+    barrier.wait()
+    start = time.perf_counter()
+    for is_read, key in ops:
+        if is_read:
+            get(key)
+        else:
+            put(key, key)
+    return time.perf_counter() - start
+
+
+def concurrent_benchmark(
+    tables: Dict[str, Callable[[], object]] = None,
+    threads: Sequence[int] = (1, 2, 4, 8),
+    read_ratios: Sequence[float] = (0.5, 0.9, 0.99),
+    ops_per_thread: int = 20_000,
+    key_space: int = 50_000,
+    seed: int = 0
+) -> List[Dict[str, float]]:
+    """
+    Mixed get/put throughput from a thread pool.
+
+    Args:
+        tables: {name: factory}, defaults to striped vs global-lock tables
+        threads: Worker counts to try
+        read_ratios: Fraction of operations that are gets
+        ops_per_thread: Operations each worker runs after a shared barrier
+        key_space: Keys are drawn uniformly from this many names
+        seed: Seed for the operation mix
+
+    Returns:
+        One row per (table, threads, read_ratio) with ops_per_sec; `gil`
+        records whether the interpreter ran with the GIL.
+    """
+    tables = tables or {
+        "striped": lambda: StripedHashTable(size=1024, stripes=64),
+        "global_lock": lambda: LockedHashTable(size=1024),
+    }
+    keys = [f"key-{i}" for i in range(key_space)]
+    rows = []
+    for read_ratio in read_ratios:
+        for n_threads in threads:
+            rng = random.Random(seed)
+            workloads = [[(rng.random() < read_ratio, rng.choice(keys))
+                          for _ in range(ops_per_thread)] for _ in range(n_threads)]
+            for name, factory in tables.items():
+                table = factory()
+                for key in keys[::2]:
+                    table.put(key, key)   # Half the keys present up front
+                barrier = threading.Barrier(n_threads + 1)
+                with ThreadPoolExecutor(max_workers=n_threads) as pool:
+                    futures = [pool.submit(_worker, table, ops, barrier) for ops in workloads]
+                    start = time.perf_counter()
+                    barrier.wait()
+                    for f in futures:
+                        f.result()
+                    elapsed = time.perf_counter() - start
+                rows.append({
+                    "table": name,
+                    "threads": n_threads,
+                    "read_ratio": read_ratio,
+                    "ops_per_sec": n_threads * ops_per_thread / elapsed,
+                    "gil": gil_enabled(),
+                })
+    return rows
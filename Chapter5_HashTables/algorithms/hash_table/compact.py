@@ -0,0 +1,217 @@
+"""
+Separate chaining in flat arrays (intrusive chaining).
+No Manim imports.
+"""
+from typing import Any, Callable, List, Optional
+from array import array
+from collections import deque
+
+from .logic import HashOperation, fnv1a_hash, DEFAULT_TRACE_LIMIT
+
+
+NIL = -1
+HASH_RANGE = 1 << 32
+
+
+class CompactHashTable:
+    """
+    Chained hash table with no per-entry or per-bucket Python objects.
+
+    Entry i lives at index i of parallel arrays: keys, values, its full
+    32-bit hash and the index of the next entry in its chain. Each bucket
+    is one int in `heads`. SimpleHashTable spends a (key, value) tuple per
+    entry and a list per bucket; here an entry costs two list references
+    and eight bytes of array.
+
+    Deleted entries are unlinked and their indexes reused through a free
+    list threaded through `next`. Because the full hash is stored, a
+    resize relinks the chains without calling hash_fn again.
+    """
+
+    __slots__ = ("size", "max_load", "auto_resize", "hash_fn", "count",
+                 "trace", "operations", "heads", "next", "hashes",
+                 "keys", "values", "_free")
+
+    def __init__(self, size: int = 10, auto_resize: bool = True, max_load: float = 1.0,
+                 hash_fn: Callable[[str, int], int] = fnv1a_hash, trace: bool = False,
+                 trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
+        self.size = size
+        self.max_load = max_load
+        self.auto_resize = auto_resize
+        self.hash_fn = hash_fn
+        self.count = 0
+        self.trace = trace
+        self.operations = deque(maxlen=trace_limit)  # Recent operations for animation
+        self.heads = array('i', [NIL]) * size
+        self.next = array('i')
+        self.hashes = array('I')
+        self.keys: List[Optional[str]] = []
+        self.values: List[Any] = []
+        self._free = NIL
+
+    def hash(self, key: str) -> int:
+        """Compute hash value (bucket index)."""
+        return self.hash_fn(key, HASH_RANGE) % self.size
+
+    def _locate(self, key: str, h: int):
+        """Returns (entry index or NIL, entries inspected)."""
+        keys, nxt, hashes = self.keys, self.next, self.hashes
+        i = self.heads[h % self.size]
+        probes = 1
+        while i != NIL:
+            if hashes[i] == h and keys[i] == key:
+                return i, probes
+            i = nxt[i]
+            probes += 1
+        return NIL, probes
+
+    def _store(self, key: str, value: Any):
+        """Upsert; returns (existed, probes)."""
+        h = self.hash_fn(key, HASH_RANGE)
+        i, probes = self._locate(key, h)
+        if i != NIL:
+            self.values[i] = value
+            return True, probes
+        if self.auto_resize and self.count + 1 > self.max_load * self.size:
+            self.resize(self.size * 2)
+        b = h % self.size
+        if self._free != NIL:
+            i = self._free
+            self._free = self.next[i]
+            self.keys[i], self.values[i], self.hashes[i] = key, value, h
+            self.next[i] = self.heads[b]
+        else:
+            i = len(self.keys)
+            self.keys.append(key)
+            self.values.append(value)
+            self.hashes.append(h)
+            self.next.append(self.heads[b])
+        self.heads[b] = i
+        self.count += 1
+        return False, probes
+
+    def _unlink(self, key: str):
+        """Remove a key; returns (value, found, probes)."""
+        h = self.hash_fn(key, HASH_RANGE)
+        b = h % self.size
+        prev, i, probes = NIL, self.heads[b], 1
+        while i != NIL:
+            if self.hashes[i] == h and self.keys[i] == key:
+                if prev == NIL:
+                    self.heads[b] = self.next[i]
+                else:
+                    self.next[prev] = self.next[i]
+                value = self.values[i]
+                self.keys[i] = self.values[i] = None   # Drop references
+                self.next[i] = self._free
+                self._free = i
+                self.count -= 1
+                return value, True, probes
+            prev, i = i, self.next[i]
+            probes += 1
+        return None, False, probes
+
+    def resize(self, new_size: int):
+        """Relink every chain into `new_size` buckets from the stored hashes."""
+        heads = array('i', [NIL]) * new_size
+        nxt, hashes, keys = self.next, self.hashes, self.keys
+        for i in range(len(keys)):
+            if keys[i] is not None:
+                b = hashes[i] % new_size
+                nxt[i] = heads[b]
+                heads[b] = i
+        self.heads = heads
+        self.size = new_size
+
+    def insert(self, key: str, value: Any) -> HashOperation:
+        """Insert a key, or overwrite its value."""
+        existed, probes = self._store(key, value)
+        idx = self.hash(key)
+        op = HashOperation(
+            operation="insert",
+            key=key,
+            value=value,
+            hash_value=idx,
+            index=idx,
+            found=True,
+            collision=existed or self.next[self.heads[idx]] != NIL,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def lookup(self, key: str) -> HashOperation:
+        """Look up a key."""
+        h = self.hash_fn(key, HASH_RANGE)
+        i, probes = self._locate(key, h)
+        op = HashOperation(
+            operation="lookup",
+            key=key,
+            value=self.values[i] if i != NIL else None,
+            hash_value=h % self.size,
+            index=h % self.size,
+            found=i != NIL,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def delete(self, key: str) -> HashOperation:
+        """Delete a key; its slot goes on the free list."""
+        value, found, probes = self._unlink(key)
+        idx = self.hash(key)
+        op = HashOperation(
+            operation="delete",
+            key=key,
+            value=value,
+            hash_value=idx,
+            index=idx,
+            found=found,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    # Mapping-style fast path: no HashOperation is built or recorded
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i, _ = self._locate(key, self.hash_fn(key, HASH_RANGE))
+        return self.values[i] if i != NIL else default
+
+    def put(self, key: str, value: Any):
+        self._store(key, value)
+
+    def remove(self, key: str) -> bool:
+        return self._unlink(key)[1]
+
+    def __contains__(self, key: str) -> bool:
+        return self._locate(key, self.hash_fn(key, HASH_RANGE))[0] != NIL
+
+    def __len__(self) -> int:
+        return self.count
+
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def get_distribution(self) -> List[int]:
+        """Entries per bucket."""
+        dist = [0] * self.size
+        for i, key in enumerate(self.keys):
+            if key is not None:
+                dist[self.hashes[i] % self.size] += 1
+        return dist
+
+    def get_probe_histogram(self) -> List[int]:
+        """hist[d] = entries stored d links down their chain (0 = head)."""
+        hist = [0]
+        for count in self.get_distribution():
+            if count > len(hist):
+                hist.extend([0] * (count - len(hist)))
+            for d in range(count):
+                hist[d] += 1
+        return hist
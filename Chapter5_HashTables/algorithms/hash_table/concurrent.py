@@ -0,0 +1,194 @@
+"""
+Thread-safe hash tables: lock striping vs one global lock.
+No Manim imports.
+"""
+from typing import Any, Callable, List, Tuple
+import threading
+
+from .logic import HashOperation, fnv1a_hash
+
+
+HASH_RANGE = 1 << 32
+
+
+class StripedHashTable:
+    """
+    Chained hash table shared between threads.
+
+    Writers lock one of `stripes` locks, chosen by hash % stripes. The
+    table size stays a multiple of the stripe count, so each stripe guards
+    a fixed residue class of buckets even across resizes.
+
+    Reads take no lock: every bucket is an immutable tuple of (key, value)
+    pairs that writers replace wholesale, so a reader sees either the old
+    or the new bucket, never a half-written one. Resizing takes every
+    stripe lock and swaps in a new bucket list.
+    """
+
+    def __init__(self, size: int = 64, stripes: int = 16, max_load: float = 0.75,
+                 hash_fn: Callable[[str, int], int] = fnv1a_hash):
+        self.stripes = stripes
+        self.max_load = max_load
+        self.hash_fn = hash_fn
+        size = max(size, stripes)
+        size += -size % stripes
+        self._buckets: List[Tuple[Tuple[str, Any], ...]] = [()] * size
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._counts = [0] * stripes   # Per-stripe, so writers never share a counter
+
+    @property
+    def size(self) -> int:
+        return len(self._buckets)
+
+    def hash(self, key: str) -> int:
+        """Full 32-bit hash; bucket = hash % size, stripe = hash % stripes."""
+        return self.hash_fn(key, HASH_RANGE)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Lock-free read."""
+        buckets = self._buckets
+        for k, v in buckets[self.hash(key) % len(buckets)]:
+            if k == key:
+                return v
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        buckets = self._buckets
+        return any(k == key for k, _ in buckets[self.hash(key) % len(buckets)])
+
+    def put(self, key: str, value: Any):
+        """Insert or overwrite."""
+        h = self.hash(key)
+        stripe = h % self.stripes
+        with self._locks[stripe]:
+            buckets = self._buckets
+            idx = h % len(buckets)
+            bucket = buckets[idx]
+            for pos, (k, _) in enumerate(bucket):
+                if k == key:
+                    buckets[idx] = bucket[:pos] + ((key, value),) + bucket[pos + 1:]
+                    return
+            buckets[idx] = bucket + ((key, value),)
+            self._counts[stripe] += 1
+        if len(self) > self.max_load * len(self._buckets):
+            self.resize(len(self._buckets) * 2)
+
+    def remove(self, key: str) -> bool:
+        """Delete a key; returns whether it was present."""
+        h = self.hash(key)
+        stripe = h % self.stripes
+        with self._locks[stripe]:
+            buckets = self._buckets
+            idx = h % len(buckets)
+            bucket = buckets[idx]
+            for pos, (k, _) in enumerate(bucket):
+                if k == key:
+                    buckets[idx] = bucket[:pos] + bucket[pos + 1:]
+                    self._counts[stripe] -= 1
+                    return True
+        return False
+
+    def resize(self, new_size: int):
+        """Rehash under every stripe lock (always taken in stripe order)."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            if len(self) <= self.max_load * len(self._buckets):
+                return   # Another thread already grew the table
+            new_size += -new_size % self.stripes
+            fresh: List[list] = [[] for _ in range(new_size)]
+            for bucket in self._buckets:
+                for key, value in bucket:
+                    fresh[self.hash(key) % new_size].append((key, value))
+            self._buckets = [tuple(b) for b in fresh]
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def insert(self, key: str, value: Any) -> HashOperation:
+        """put() with a HashOperation result, matching SimpleHashTable."""
+        self.put(key, value)
+        h = self.hash(key)
+        return HashOperation("insert", key, value, h, h % self.size, True, False)
+
+    def lookup(self, key: str) -> HashOperation:
+        h = self.hash(key)
+        buckets = self._buckets
+        idx = h % len(buckets)
+        for probes, (k, v) in enumerate(buckets[idx], start=1):
+            if k == key:
+                return HashOperation("lookup", key, v, h, idx, True, probes > 1, probes)
+        return HashOperation("lookup", key, None, h, idx, False,
+                             len(buckets[idx]) > 0, len(buckets[idx]) + 1)
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def load_factor(self) -> float:
+        return len(self) / self.size
+
+    def get_distribution(self) -> List[int]:
+        return [len(b) for b in self._buckets]
+
+
+class LockedHashTable:
+    """
+    Plain chained buckets behind one global lock for reads and writes:
+    the baseline that striping and lock-free reads are measured against.
+    The buckets themselves take no locks, so only the global one is paid.
+    """
+
+    def __init__(self, size: int = 64, max_load: float = 0.75,
+                 hash_fn: Callable[[str, int], int] = fnv1a_hash):
+        self.max_load = max_load
+        self.hash_fn = hash_fn
+        self._buckets: List[List[Tuple[str, Any]]] = [[] for _ in range(size)]
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: str) -> List[Tuple[str, Any]]:
+        return self._buckets[self.hash_fn(key, HASH_RANGE) % len(self._buckets)]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            for k, v in self._bucket(key):
+                if k == key:
+                    return v
+            return default
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            bucket = self._bucket(key)
+            for pos, (k, _) in enumerate(bucket):
+                if k == key:
+                    bucket[pos] = (key, value)
+                    return
+            bucket.append((key, value))
+            self._count += 1
+            if self._count > self.max_load * len(self._buckets):
+                self._grow()
+
+    def _grow(self):
+        """Double the bucket count; called with the lock held."""
+        old = self._buckets
+        self._buckets = [[] for _ in range(len(old) * 2)]
+        for bucket in old:
+            for key, value in bucket:
+                self._bucket(key).append((key, value))
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            bucket = self._bucket(key)
+            for pos, (k, _) in enumerate(bucket):
+                if k == key:
+                    del bucket[pos]
+                    self._count -= 1
+                    return True
+            return False
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return any(k == key for k, _ in self._bucket(key))
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,245 @@
+"""
+Consistent hashing: keys and (virtual) nodes share one hash ring.
+No Manim imports.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from bisect import bisect_left, insort
+import math
+
+import numpy as np
+
+from .logic import hash64
+from .batch_hash import batch_hash64
+
+
+class ConsistentHashRing:
+    """
+    Each node owns `vnodes * weight` points on a 64-bit ring; a key belongs
+    to the first point clockwise from its hash64. Adding or removing a node
+    only moves the keys on the arcs that node gains or loses.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = 100,
+                 hash_fn: Callable[[str], int] = hash64):
+        self.vnodes = vnodes
+        self.hash_fn = hash_fn
+        self.weights: Dict[str, int] = {}
+        self._points: List[int] = []    # Sorted ring positions
+        self._owners: Dict[int, str] = {}
+        self._array: Optional[np.ndarray] = None   # Cached for assign_many
+        self._array_owners: Optional[List[str]] = None
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self.weights)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def _node_points(self, node: str, weight: int) -> List[int]:
+        return [self.hash_fn(f"{node}#{i}") for i in range(self.vnodes * weight)]
+
+    def add_node(self, node: str, weight: int = 1):
+        if node in self.weights:
+            raise ValueError(f"Node already on the ring: {node!r}")
+        self.weights[node] = weight
+        for point in self._node_points(node, weight):
+            # A point collision keeps the earlier owner; it is vanishingly rare
+            if point not in self._owners:
+                self._owners[point] = node
+                insort(self._points, point)
+        self._array = self._array_owners = None
+
+    def remove_node(self, node: str):
+        weight = self.weights.pop(node)
+        for point in self._node_points(node, weight):
+            if self._owners.get(point) == node:
+                del self._owners[point]
+        self._points = [p for p in self._points if p in self._owners]
+        self._array = self._array_owners = None
+
+    def copy(self) -> "ConsistentHashRing":
+        """Independent ring of the same type (the NumPy cache is shared until either changes)."""
+        ring = type(self).__new__(type(self))
+        ring.__dict__.update(self.__dict__)
+        ring.weights = dict(self.weights)
+        ring._points = list(self._points)
+        ring._owners = dict(self._owners)
+        return ring
+
+    def _successor(self, h: int) -> int:
+        """Index of the first ring point at or after h (wrapping)."""
+        return bisect_left(self._points, h) % len(self._points)
+
+    def node_for(self, key: str) -> str:
+        if not self._points:
+            raise LookupError("Ring has no nodes")
+        return self._owners[self._points[self._successor(self.hash_fn(key))]]
+
+    def assign_many(self, keys: Iterable[str]) -> List[str]:
+        """node_for() for many keys: hash64 and searchsorted in NumPy."""
+        if not self._points:
+            raise LookupError("Ring has no nodes")
+        if self.hash_fn is not hash64:
+            return [self.node_for(k) for k in keys]
+        if self._array is None:
+            self._array = np.array(self._points, dtype=np.uint64)
+            self._array_owners = [self._owners[p] for p in self._points]
+        idx = np.searchsorted(self._array, batch_hash64(keys), side="left") % len(self._array)
+        owners = self._array_owners
+        return [owners[i] for i in idx.tolist()]
+
+    def load(self, keys: Iterable[str]) -> Dict[str, int]:
+        """Keys per node."""
+        counts = {node: 0 for node in self.weights}
+        for node in self.assign_many(keys):
+            counts[node] += 1
+        return counts
+
+
+class BoundedLoadRing(ConsistentHashRing):
+    """
+    Consistent hashing with bounded loads (Mirrokni, Thorup, Zadimoghaddam):
+    no node holds more than ceil((1 + epsilon) * average) keys. A key whose
+    node is full walks clockwise to the next node with room.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = 100,
+                 epsilon: float = 0.25, hash_fn: Callable[[str], int] = hash64):
+        self.epsilon = epsilon
+        self.loads: Dict[str, int] = {}
+        self.assignments: Dict[str, str] = {}
+        super().__init__(nodes, vnodes, hash_fn)
+
+    def add_node(self, node: str, weight: int = 1):
+        """
+        Add a node and move to it the keys whose ring successor it now is;
+        nodes left above the lower cap shed their excess keys too.
+        """
+        super().add_node(node, weight)
+        self.loads[node] = 0
+        if not self.assignments:
+            return
+        keys = list(self.assignments)
+        cap = self.capacity(extra=0)
+        movers = [k for k, first in zip(keys, self.assign_many(keys)) if first == node]
+        excess = {n: load - cap for n, load in self.loads.items()}
+        for key in movers:
+            excess[self.assignments[key]] -= 1
+        moving = set(movers)
+        for key in keys:
+            holder = self.assignments[key]
+            if excess[holder] > 0 and key not in moving:
+                movers.append(key)
+                excess[holder] -= 1
+        self._reassign(movers, cap)
+
+    def remove_node(self, node: str):
+        """Remove a node and reassign only the keys it held."""
+        if self.assignments and set(self.weights) == {node}:
+            raise LookupError("Cannot remove the last node while keys are assigned")
+        super().remove_node(node)
+        del self.loads[node]
+        cap = self.capacity(extra=0)
+        self._reassign([k for k, n in self.assignments.items() if n == node], cap)
+
+    def _reassign(self, keys: List[str], cap: int):
+        """Release keys, then place each under a cap fixed for the whole batch."""
+        for key in keys:
+            node = self.assignments.pop(key)
+            if node in self.loads:
+                self.loads[node] -= 1
+        for key in keys:
+            self._place(key, cap)
+
+    def copy(self) -> "BoundedLoadRing":
+        ring = super().copy()
+        ring.loads = dict(self.loads)
+        ring.assignments = dict(self.assignments)
+        return ring
+
+    def capacity(self, extra: int = 1) -> int:
+        """Per-node cap with `extra` more keys assigned."""
+        total = len(self.assignments) + extra
+        return math.ceil((1 + self.epsilon) * total / max(len(self.weights), 1))
+
+    def assign(self, key: str) -> str:
+        """Place a key (idempotent) and return its node."""
+        node = self.assignments.get(key)
+        if node is not None:
+            return node
+        if not self._points:
+            raise LookupError("Ring has no nodes")
+        return self._place(key, self.capacity())
+
+    def _place(self, key: str, cap: int) -> str:
+        """Walk clockwise from the key's successor to the first node below cap."""
+        i = self._successor(self.hash_fn(key))
+        for step in range(len(self._points)):
+            node = self._owners[self._points[(i + step) % len(self._points)]]
+            if self.loads[node] < cap:
+                break
+        self.loads[node] += 1
+        self.assignments[key] = node
+        return node
+
+    def release(self, key: str):
+        node = self.assignments.pop(key, None)
+        if node is not None:
+            self.loads[node] -= 1
+
+
+def key_movement(keys: Sequence[str], before: Sequence[str], after: Sequence[str]) -> Dict[str, float]:
+    """
+    Compare two assignments of the same keys.
+
+    Returns:
+        {"moved": keys whose node changed, "fraction": moved / keys}
+    """
+    moved = sum(1 for a, b in zip(before, after) if a != b)
+    return {"moved": moved, "fraction": moved / max(len(keys), 1)}
+
+
+def load_spread(counts: Dict[str, int]) -> Dict[str, float]:
+    """Skew of a {node: keys} load: max/mean and stddev/mean (0 = perfectly even)."""
+    values = np.array(list(counts.values()), dtype=np.float64)
+    if not len(values) or values.mean() == 0:
+        return {"max_over_mean": 0.0, "stddev_over_mean": 0.0}
+    mean = values.mean()
+    return {"max_over_mean": float(values.max() / mean),
+            "stddev_over_mean": float(values.std() / mean)}
+
+
+def rebalance_cost(keys: Sequence[str], ring: ConsistentHashRing,
+                   add: Sequence[str] = (), remove: Sequence[str] = ()) -> Dict[str, float]:
+    """
+    Key movement and skew for a node-count change, without touching `ring`.
+    The ideal moved fraction is |change| / max(nodes before, nodes after).
+
+    A BoundedLoadRing is compared through its `assignments` (keys not yet
+    placed are assigned on a copy first), so the caps are honoured.
+    """
+    keys = list(keys)
+    bounded = isinstance(ring, BoundedLoadRing)
+    if bounded:
+        ring = ring.copy()
+        for key in keys:
+            ring.assign(key)
+        before = [ring.assignments[k] for k in keys]
+    else:
+        before = ring.assign_many(keys)
+    changed = ring.copy()
+    for node in add:
+        changed.add_node(node)
+    for node in remove:
+        changed.remove_node(node)
+    after = [changed.assignments[k] for k in keys] if bounded else changed.assign_many(keys)
+    stats = key_movement(keys, before, after)
+    stats["ideal_fraction"] = (len(add) + len(remove)) / max(len(ring), len(changed), 1)
+    counts = {node: 0 for node in changed.weights}
+    for node in after:
+        counts[node] += 1
+    stats.update({f"after_{k}": v for k, v in load_spread(counts).items()})
+    return stats
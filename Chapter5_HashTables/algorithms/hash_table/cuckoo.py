@@ -0,0 +1,221 @@
+"""
+Cuckoo hash table: every key has exactly two possible slots.
+No Manim imports.
+"""
+from typing import Any, Callable, List, Optional, Tuple
+from collections import deque
+import random
+
+from .logic import HashOperation, fnv1a_hash, multiply_shift_hash, fmix64, DEFAULT_TRACE_LIMIT
+
+
+HASH_RANGE = 1 << 32
+
+CUCKOO_COMPLEXITY = {
+    "search_avg": "O(1)",
+    "search_worst": "O(1)",      # Two slots plus a small stash
+    "insert_avg": "O(1)",        # Amortized over rehashes
+    "insert_worst": "O(n)",      # A failed eviction chain rebuilds the table
+    "delete_avg": "O(1)",
+    "delete_worst": "O(1)",
+}
+
+
+class CuckooHashTable:
+    """
+    Two tables, two hash functions. A key lives in slot h1(key) of table 0
+    or slot h2(key) of table 1, so a lookup reads at most two slots plus
+    the stash: no chains, no probe sequences.
+
+    Inserting into an occupied slot evicts the resident to its other slot,
+    up to max_kicks times. A key left homeless goes to a small stash; when
+    the stash is full, the table rehashes with fresh salts (and doubles if
+    it is past max_load).
+
+    `index` in recorded operations is the flat slot table * size + slot,
+    or -1 for the stash.
+    """
+
+    def __init__(self, size: int = 8, max_load: float = 0.45, max_kicks: int = 32,
+                 stash_size: int = 4,
+                 hash_fns: Tuple[Callable[[str, int], int], ...] = (fnv1a_hash, multiply_shift_hash),
+                 seed: int = 0, trace: bool = False,
+                 trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
+        self.max_load = max_load
+        self.max_kicks = max_kicks
+        self.stash_size = stash_size
+        self.hash_fns = hash_fns
+        self.count = 0
+        self.displacements = 0   # Residents moved by eviction chains, ever
+        self.trace = trace
+        self.operations = deque(maxlen=trace_limit)  # Recent operations for animation
+        self._rng = random.Random(seed)
+        self._allocate(size)
+
+    def _allocate(self, size: int):
+        self.size = size
+        self.keys = [[None] * size, [None] * size]
+        self.values = [[None] * size, [None] * size]
+        self.stash: List[Tuple[str, Any]] = []
+        # New salts give a different pair of hash functions after a rehash
+        self.salts = (self._rng.getrandbits(64), self._rng.getrandbits(64))
+
+    def hash(self, key: str, table: int) -> int:
+        """
+        Slot of key in table 0 or 1. The salt is mixed in before the
+        reduction: XORing it into the slot would only permute slots (the
+        size is a power of two), leaving the same keys colliding.
+        """
+        return fmix64(self.hash_fns[table](key, HASH_RANGE) ^ self.salts[table]) % self.size
+
+    def _record(self, operation: str, key: str, value: Any, hash_value: int, index: int,
+                found: bool, collision: bool, probes: int) -> HashOperation:
+        op = HashOperation(operation, key, value, hash_value, index, found, collision, probes)
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def _flat(self, t: int, i: int) -> int:
+        return -1 if t < 0 else t * self.size + i
+
+    def _locate(self, key: str):
+        """Returns (table or -1 for stash, slot, probes); table is None if absent."""
+        for t in (0, 1):
+            i = self.hash(key, t)
+            if self.keys[t][i] == key:
+                return t, i, t + 1
+        for pos, (k, _) in enumerate(self.stash):
+            if k == key:
+                return -1, pos, 3 + pos
+        return None, -1, 2 + len(self.stash)
+
+    def _kick(self, key: str, value: Any):
+        """
+        Eviction chain. Returns the entry left without a slot, or None.
+        Records a "displace" operation for every resident that moves.
+        """
+        t = 0
+        for kicks in range(self.max_kicks):
+            i = self.hash(key, t)
+            if self.keys[t][i] is None:
+                self.keys[t][i], self.values[t][i] = key, value
+                return None
+            # Swap in and carry the resident over to its other table
+            key, self.keys[t][i] = self.keys[t][i], key
+            value, self.values[t][i] = self.values[t][i], value
+            t = 1 - t
+            self.displacements += 1
+            home = self.hash(key, t)
+            self._record("displace", key, value, home, self._flat(t, home), True, True, kicks + 1)
+        return key, value
+
+    def _rehash(self, new_size: int):
+        entries = [(k, v) for t in (0, 1) for k, v in zip(self.keys[t], self.values[t])
+                   if k is not None] + self.stash
+        old_size = self.size
+        attempts = 0
+        while True:
+            self._allocate(new_size)
+            if all(self._place(k, v) for k, v in entries):
+                break
+            # Fresh salts give new slot pairs, so a retry usually breaks the
+            # cycle; three failures in a row mean the table is too full
+            attempts += 1
+            if attempts % 3 == 0:
+                new_size *= 2
+        self._record("resize" if new_size != old_size else "rehash", "", self.size,
+                     old_size, -1, False, False, 0)
+
+    def _place(self, key: str, value: Any) -> bool:
+        """Kick chain then stash; False when both fail."""
+        homeless = self._kick(key, value)
+        if homeless is None:
+            return True
+        if len(self.stash) < self.stash_size:
+            self.stash.append(homeless)
+            return True
+        # Put the last evicted entry back so nothing is lost before a rehash
+        self.stash.append(homeless)
+        return False
+
+    def insert(self, key: str, value: Any) -> HashOperation:
+        """Insert or update a key-value pair."""
+        t, i, probes = self._locate(key)
+        if t is not None:
+            if t < 0:
+                self.stash[i] = (key, value)
+            else:
+                self.values[t][i] = value
+            return self._record("insert", key, value, self.hash(key, 0), self._flat(t, i),
+                                True, False, probes)
+
+        if (self.count + 1) / (2 * self.size) > self.max_load:
+            self._rehash(self.size * 2)
+        before = self.displacements
+        if not self._place(key, value):
+            self._rehash(self.size)
+        self.count += 1
+        kicks = self.displacements - before
+        t, i, probes = self._locate(key)
+        return self._record("insert", key, value, self.hash(key, 0), self._flat(t, i), True,
+                            kicks > 0 or t != 0, probes + kicks)
+
+    def lookup(self, key: str) -> HashOperation:
+        """Look up a key: at most two slots plus the stash."""
+        t, i, probes = self._locate(key)
+        found = t is not None
+        value = None
+        if found:
+            value = self.stash[i][1] if t < 0 else self.values[t][i]
+        index = self._flat(t, i) if found else self.hash(key, 0)
+        return self._record("lookup", key, value, self.hash(key, 0), index, found,
+                            probes > 1, probes)
+
+    def delete(self, key: str) -> HashOperation:
+        """Delete a key. Slots simply empty: no tombstones are needed."""
+        t, i, probes = self._locate(key)
+        found = t is not None
+        value = None
+        index = self.hash(key, 0)
+        if found:
+            index = self._flat(t, i)
+            if t < 0:
+                value = self.stash.pop(i)[1]
+            else:
+                value = self.values[t][i]
+                self.keys[t][i] = self.values[t][i] = None
+            self.count -= 1
+        return self._record("delete", key, value, self.hash(key, 0), index,
+                            found, probes > 1, probes)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value for key, or default, without recording an operation."""
+        for t in (0, 1):
+            i = self.hash(key, t)
+            if self.keys[t][i] == key:
+                return self.values[t][i]
+        for k, v in self.stash:
+            if k == key:
+                return v
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        return self._locate(key)[0] is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def load_factor(self) -> float:
+        """Items / slots across both tables."""
+        return self.count / (2 * self.size)
+
+    def get_distribution(self) -> List[int]:
+        """Occupancy (0 or 1) of every slot, table 0 then table 1."""
+        return [int(k is not None) for t in (0, 1) for k in self.keys[t]]
+
+    def get_probe_histogram(self) -> List[int]:
+        """hist[p - 1] = entries found after p slot reads (3+ = stash)."""
+        hist = [sum(k is not None for k in self.keys[0]),
+                sum(k is not None for k in self.keys[1])]
+        hist.extend([1] * len(self.stash))
+        return hist
@@ -2,20 +2,22 @@
 Pure hash table operations.
 No Manim imports.
 """
-from typing import Any, Optional, List, Tuple
+from typing import Any, Callable, Optional, List, Tuple
+from collections import deque
 from dataclasses import dataclass
 
 
 @dataclass
 class HashOperation:
     """Represents a hash table operation."""
-    operation: str        # "insert", "lookup", "delete", "collision"
+    operation: str        # "insert", "lookup", "delete", "collision", "resize", "compact"
     key: str
     value: Any
     hash_value: int
     index: int
     found: bool
     collision: bool
+    probes: int = 1       # Slots or chain entries inspected
 
 
 def simple_hash(key: str, table_size: int = 10) -> int:
@@ -33,32 +35,204 @@ def first_letter_hash(key: str, table_size: int = 26) -> int:
     return (ord(key[0].lower()) - ord('a')) % table_size
 
 
+FNV_OFFSET = 0x811C9DC5
+FNV_PRIME = 0x01000193
+# 2^64 / golden ratio, the usual odd multiplier for multiply-shift hashing
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+MASK32 = 0xFFFFFFFF
+MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def fnv1a_hash(key: str, table_size: int = 10) -> int:
+    """32-bit FNV-1a over the UTF-8 bytes of the key."""
+    h = FNV_OFFSET
+    for byte in key.encode("utf-8"):
+        h = ((h ^ byte) * FNV_PRIME) & MASK32
+    return h % table_size
+
+
+def multiply_shift_hash(key: str, table_size: int = 10) -> int:
+    """
+    Polynomial fold of the characters into 64 bits, then multiply-shift:
+    the high 32 bits of h * GOLDEN_GAMMA mix every input bit.
+    """
+    h = 0
+    for c in key:
+        h = (h * 31 + ord(c)) & MASK64
+    return (((h * GOLDEN_GAMMA) & MASK64) >> 32) % table_size
+
+
+FNV64_OFFSET = 0xCBF29CE484222325
+FNV64_PRIME = 0x100000001B3
+FMIX64_C1 = 0xFF51AFD7ED558CCD
+FMIX64_C2 = 0xC4CEB9FE1A85EC53
+
+
+def fmix64(h: int) -> int:
+    """MurmurHash3 finalizer: every input bit affects every output bit."""
+    h ^= h >> 33
+    h = (h * FMIX64_C1) & MASK64
+    h ^= h >> 33
+    h = (h * FMIX64_C2) & MASK64
+    return h ^ (h >> 33)
+
+
+def hash64(key: str, table_size: int = 1 << 64) -> int:
+    """
+    64-bit FNV-1a followed by fmix64, which spreads every input bit over
+    the high bits FNV alone mixes poorly.
+    """
+    h = FNV64_OFFSET
+    for byte in key.encode("utf-8"):
+        h = ((h ^ byte) * FNV64_PRIME) & MASK64
+    return fmix64(h) % table_size
+
+
+# Marks a deleted entry so chain positions stay stable until compaction
+TOMBSTONE = ("", None)
+
+# Operations kept when tracing, oldest dropped first
+DEFAULT_TRACE_LIMIT = 1024
+
+
 class SimpleHashTable:
-    """Hash table implementation for animation states."""
+    """
+    Hash table implementation for animation states.
+
+    With auto_resize, the table doubles when the load factor passes
+    max_load and halves when it drops below min_load. Rehashing is
+    incremental: each operation migrates `rehash_step` old buckets, so no
+    single insert pays for moving every entry.
+
+    Deletes leave tombstones; once they exceed tombstone_limit * size the
+    table compacts itself through the same incremental rehash.
+
+    With trace=True the last `trace_limit` HashOperations are kept in
+    `operations`, a deque ring buffer (trace_limit=None keeps them all).
+    get/put/remove never build HashOperations, for use as a plain mapping.
+    """
     
-    def __init__(self, size: int = 10):
+    def __init__(self, size: int = 10, auto_resize: bool = False,
+                 max_load: float = 0.7, min_load: float = 0.1, rehash_step: int = 4,
+                 hash_fn: Callable[[str, int], int] = simple_hash,
+                 tombstone_limit: float = 0.25, trace: bool = False,
+                 trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
         self.size = size
+        self.hash_fn = hash_fn
         self.table = [None] * size
-        self.chains = [[] for _ in range(size)]  # For chaining
+        self.chains = [None] * size  # For chaining; a list is made on first collision
         self.count = 0
-        self.operations = []  # Track operations for animation
+        self.tombstones = 0
+        self.tombstone_limit = tombstone_limit
+        self.trace = trace
+        self.operations = deque(maxlen=trace_limit)  # Recent operations for animation
+        
+        self.auto_resize = auto_resize
+        self.max_load = max_load
+        self.min_load = min_load
+        self.min_size = size
+        self.rehash_step = max(rehash_step, 1)
+        # Buckets still waiting to move during an incremental rehash
+        self._old_table = None
+        self._old_chains = None
+        self._old_size = 0
+        self._rehash_pos = 0
     
     def hash(self, key: str) -> int:
         """Compute hash value."""
-        return simple_hash(key, self.size)
+        return self.hash_fn(key, self.size)
+    
+    @property
+    def rehashing(self) -> bool:
+        return self._old_table is not None
+    
+    def _place(self, key: str, value: Any) -> int:
+        """Store in the current table; returns the chain position (0 = slot)."""
+        idx = self.hash(key)
+        slot = self.table[idx]
+        if slot is None or slot is TOMBSTONE:
+            if slot is TOMBSTONE:
+                self.tombstones -= 1
+            self.table[idx] = (key, value)
+            return 0
+        chain = self.chains[idx]
+        if chain is None:
+            chain = self.chains[idx] = []
+        for pos, entry in enumerate(chain):
+            if entry is TOMBSTONE:
+                chain[pos] = (key, value)
+                self.tombstones -= 1
+                return pos + 1
+        chain.append((key, value))
+        return len(chain)
+    
+    def _migrate(self, buckets: int):
+        """Move up to `buckets` old buckets into the current table."""
+        while self.rehashing and buckets > 0:
+            i = self._rehash_pos
+            slot = self._old_table[i]
+            if slot is not None and slot is not TOMBSTONE:
+                self._place(*slot)
+            for entry in self._old_chains[i] or ():
+                if entry is not TOMBSTONE:
+                    self._place(*entry)
+            self._old_table[i] = None
+            self._old_chains[i] = None
+            self._rehash_pos += 1
+            buckets -= 1
+            if self._rehash_pos >= self._old_size:
+                self._old_table = self._old_chains = None
+                self._old_size = self._rehash_pos = 0
+    
+    def resize(self, new_size: int, operation: str = "resize") -> HashOperation:
+        """Start an incremental rehash into `new_size` buckets."""
+        # A rehash already in flight is finished first
+        self._migrate(self._old_size)
+        old_size = self.size
+        self._old_table, self._old_chains = self.table, self.chains
+        self._old_size, self._rehash_pos = old_size, 0
+        self.size = new_size
+        # Flat allocations only: chain lists appear lazily as buckets collide
+        self.table = [None] * new_size
+        self.chains = [None] * new_size
+        # Old tombstones are dropped as their buckets migrate
+        self.tombstones = 0
+        
+        op = HashOperation(
+            operation=operation,
+            key="",
+            value=new_size,
+            hash_value=old_size,
+            index=-1,
+            found=False,
+            collision=False,
+            probes=0
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+    
+    def compact(self) -> HashOperation:
+        """Rehash into a same-size table, dropping tombstones."""
+        return self.resize(self.size, operation="compact")
+    
+    def _maybe_resize(self):
+        if self.rehashing:
+            return
+        if self.auto_resize and self.load_factor() > self.max_load:
+            self.resize(self.size * 2)
+        elif (self.auto_resize and self.load_factor() < self.min_load
+              and self.size // 2 >= self.min_size):
+            self.resize(self.size // 2)
+        elif self.tombstones > self.tombstone_limit * self.size:
+            self.compact()
     
     def insert(self, key: str, value: Any) -> HashOperation:
         """Insert key-value pair."""
+        self._migrate(self.rehash_step)
         h = self.hash(key)
         idx = h
-        collision = self.table[idx] is not None
-        
-        if collision:
-            # Add to chain
-            self.chains[idx].append((key, value))
-        else:
-            self.table[idx] = (key, value)
-        
+        depth = self._place(key, value)
         self.count += 1
         
         op = HashOperation(
@@ -68,31 +242,62 @@ class SimpleHashTable:
             hash_value=h,
             index=idx,
             found=True,
-            collision=collision
+            collision=depth > 0,
+            probes=depth + 1
         )
-        self.operations.append(op)
+        if self.trace:
+            self.operations.append(op)
+        self._maybe_resize()
         return op
     
+    def _find(self, table, chains, idx, key):
+        """
+        Returns (found, value, entries inspected).
+        When found, probes - 1 is the position (0 = slot, n = chain[n - 1]).
+        """
+        slot = table[idx]
+        if slot is None:
+            return False, None, 1
+        if slot is not TOMBSTONE and slot[0] == key:
+            return True, slot[1], 1
+        chain = chains[idx] or ()
+        for probes, entry in enumerate(chain, start=2):
+            if entry is not TOMBSTONE and entry[0] == key:
+                return True, entry[1], probes
+        return False, None, len(chain) + 1
+    
+    def _search(self, key: str):
+        """
+        Find a key in its current bucket, then in its old bucket if that
+        has not migrated yet. Returns (found, value, probes, location);
+        location is (table, chains, idx, position probes) when found.
+        """
+        idx = self.hash(key)
+        found, value, probes = self._find(self.table, self.chains, idx, key)
+        if found:
+            return True, value, probes, (self.table, self.chains, idx, probes)
+        if self.rehashing:
+            old_idx = self.hash_fn(key, self._old_size)
+            if old_idx >= self._rehash_pos:
+                found, value, extra = self._find(self._old_table, self._old_chains, old_idx, key)
+                location = (self._old_table, self._old_chains, old_idx, extra) if found else None
+                return found, value, probes + extra, location
+        return False, None, probes, None
+    
+    @staticmethod
+    def _overwrite(location, entry):
+        table, chains, idx, probes = location
+        if probes == 1:
+            table[idx] = entry
+        else:
+            chains[idx][probes - 2] = entry
+    
     def lookup(self, key: str) -> HashOperation:
         """Look up a key."""
+        self._migrate(self.rehash_step)
         h = self.hash(key)
         idx = h
-        found = False
-        value = None
-        
-        if self.table[idx] is not None:
-            stored_key, stored_value = self.table[idx]
-            if stored_key == key:
-                found = True
-                value = stored_value
-        
-        if not found:
-            # Check chain
-            for k, v in self.chains[idx]:
-                if k == key:
-                    found = True
-                    value = v
-                    break
+        found, value, probes, _ = self._search(key)
         
         op = HashOperation(
             operation="lookup",
@@ -101,11 +306,80 @@ class SimpleHashTable:
             hash_value=h,
             index=idx,
             found=found,
-            collision=len(self.chains[idx]) > 0
+            collision=bool(self.chains[idx]),
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+    
+    def delete(self, key: str) -> HashOperation:
+        """Delete a key, leaving a tombstone in its place."""
+        self._migrate(self.rehash_step)
+        h = self.hash(key)
+        idx = h
+        found, value, probes, location = self._search(key)
+        if found:
+            self._overwrite(location, TOMBSTONE)
+            # Tombstones left in old buckets vanish when those migrate
+            if location[0] is self.table:
+                self.tombstones += 1
+            self.count -= 1
+        
+        op = HashOperation(
+            operation="delete",
+            key=key,
+            value=value,
+            hash_value=h,
+            index=idx,
+            found=found,
+            collision=bool(self.chains[idx]),
+            probes=probes
         )
-        self.operations.append(op)
+        if self.trace:
+            self.operations.append(op)
+        if found:
+            self._maybe_resize()
         return op
     
+    # Mapping-style fast path: no HashOperation is built or recorded
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value for key, or default."""
+        self._migrate(self.rehash_step)
+        found, value, _, _ = self._search(key)
+        return value if found else default
+    
+    def put(self, key: str, value: Any):
+        """Insert, or overwrite the value of an existing key."""
+        self._migrate(self.rehash_step)
+        found, _, _, location = self._search(key)
+        if found:
+            self._overwrite(location, (key, value))
+            return
+        self._place(key, value)
+        self.count += 1
+        self._maybe_resize()
+    
+    def remove(self, key: str) -> bool:
+        """Delete a key; returns whether it was present."""
+        self._migrate(self.rehash_step)
+        found, _, _, location = self._search(key)
+        if not found:
+            return False
+        self._overwrite(location, TOMBSTONE)
+        if location[0] is self.table:
+            self.tombstones += 1
+        self.count -= 1
+        self._maybe_resize()
+        return True
+    
+    def __contains__(self, key: str) -> bool:
+        return self._search(key)[0]
+    
+    def __len__(self) -> int:
+        return self.count
+    
     def load_factor(self) -> float:
         """Calculate current load factor."""
         return self.count / self.size
@@ -115,11 +389,27 @@ class SimpleHashTable:
         dist = []
         for i in range(self.size):
             count = 0
-            if self.table[i] is not None:
+            if self.table[i] is not None and self.table[i] is not TOMBSTONE:
                 count = 1
-            count += len(self.chains[i])
+            count += sum(1 for entry in self.chains[i] or () if entry is not TOMBSTONE)
             dist.append(count)
+        # Entries not yet migrated are counted where they will land
+        if self.rehashing:
+            for i in range(self._rehash_pos, self._old_size):
+                for entry in [self._old_table[i]] + (self._old_chains[i] or []):
+                    if entry is not None and entry is not TOMBSTONE:
+                        dist[self.hash(entry[0])] += 1
         return dist
+    
+    def get_probe_histogram(self) -> List[int]:
+        """hist[d] = entries stored d links down their chain (0 = in the slot)."""
+        hist = [0]
+        for count in self.get_distribution():
+            if count > len(hist):
+                hist.extend([0] * (count - len(hist)))
+            for d in range(count):
+                hist[d] += 1
+        return hist
 
 
 # Demo data
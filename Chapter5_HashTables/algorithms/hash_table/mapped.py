@@ -0,0 +1,310 @@
+"""
+Hash table stored in a file and read through mmap.
+No Manim imports.
+
+File layout (little-endian):
+    header     64 bytes: magic, version, buckets, count, heap end
+    directory  8 bytes per bucket: offset of the newest record in its chain (0 = empty)
+    heap       records, 8-byte aligned, each followed by its key and value bytes:
+               next offset, hash64, key length, value length, flags
+"""
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+from collections import deque
+import mmap
+import os
+import pickle
+import struct
+
+from .logic import HashOperation, hash64, DEFAULT_TRACE_LIMIT
+
+
+MAPPED_MAGIC = b"HTF1"
+MAPPED_VERSION = 1
+# magic, version, (pad), buckets, count, heap end
+MAPPED_HEADER = struct.Struct("<4sHxxQQQ")
+HEADER_BYTES = 64
+SLOT = struct.Struct("<Q")
+# next offset, hash64, key length, value length, flags
+RECORD = struct.Struct("<QQIIB")
+DELETED = 1
+MIN_HEAP = 1 << 16
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class MappedHashTable:
+    """
+    Chained hash table whose buckets and entries live in a file.
+
+    Lookups unpack records straight from the mapping, so opening a large
+    table costs nothing up front and the OS page cache is shared by every
+    process that maps the same file. Each record stores the key's full
+    hash64, so a chain walk compares key bytes only on a hash match.
+
+    Writes append a record and then publish it by pointing the bucket
+    directory at it: a reader sees the old chain or the new one. Overwrites
+    and deletes flag the old record; its bytes stay in the file. The
+    bucket count is fixed when the file is created; use build() to size a
+    table for a known key set. One process writes, any number read.
+
+    Values go through encode/decode (pickle by default); pass
+    encode=bytes, decode=bytes to store raw bytes.
+    """
+
+    def __init__(self, path: str, size: int = 1024, readonly: bool = False,
+                 encode: Callable[[Any], bytes] = pickle.dumps,
+                 decode: Callable[[bytes], Any] = pickle.loads,
+                 trace: bool = False, trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
+        self.path = path
+        self.readonly = readonly
+        self.encode = encode
+        self.decode = decode
+        self.trace = trace
+        self.operations = deque(maxlen=trace_limit)
+
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError(path)
+            self._create(path, size)
+        self._file = open(path, "rb" if readonly else "r+b")
+        self._mm = None
+        self._map()
+        magic, version, self.size, _, _ = MAPPED_HEADER.unpack_from(self._mm)
+        if magic != MAPPED_MAGIC or version != MAPPED_VERSION:
+            self.close()
+            raise ValueError(f"Not a mapped hash table file: {path!r}")
+        self._heap_start = HEADER_BYTES + SLOT.size * self.size
+
+    @staticmethod
+    def _create(path: str, size: int):
+        heap_start = HEADER_BYTES + SLOT.size * size
+        with open(path, "wb") as f:
+            f.write(MAPPED_HEADER.pack(MAPPED_MAGIC, MAPPED_VERSION, size, 0, heap_start))
+            f.truncate(heap_start + MIN_HEAP)
+
+    @classmethod
+    def build(cls, path: str, items: Iterable[Tuple[str, Any]],
+              max_load: float = 0.75, **kwargs) -> "MappedHashTable":
+        """Write a new file holding `items`, with buckets sized for max_load."""
+        items = list(items)
+        if os.path.exists(path):
+            os.remove(path)
+        table = cls(path, size=max(1, int(len(items) / max_load)), **kwargs)
+        for key, value in items:
+            table.put(key, value)
+        table.flush()
+        return table
+
+    # File and mapping
+
+    def _map(self):
+        if self._mm is not None:
+            self._mm.close()
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def _reserve(self, end: int):
+        """Grow the file (doubling) so the mapping covers byte `end`."""
+        if end <= len(self._mm):
+            return
+        new_len = len(self._mm)
+        while new_len < end:
+            new_len *= 2
+        self._mm.flush()
+        self._mm.close()
+        self._mm = None
+        self._file.truncate(new_len)
+        self._map()
+
+    def _ensure(self, end: int):
+        """Readers remap when the writer has grown the file past their view."""
+        if end > len(self._mm):
+            self._map()
+
+    def _header(self) -> Tuple[int, int]:
+        """(count, heap end) as currently published."""
+        _, _, _, count, heap_end = MAPPED_HEADER.unpack_from(self._mm)
+        return count, heap_end
+
+    def _set_header(self, count: int, heap_end: int):
+        MAPPED_HEADER.pack_into(self._mm, 0, MAPPED_MAGIC, MAPPED_VERSION,
+                                self.size, count, heap_end)
+
+    def flush(self):
+        """Push dirty pages to disk."""
+        if not self.readonly:
+            self._mm.flush()
+
+    def close(self):
+        if self._mm is not None:
+            self.flush()
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "MappedHashTable":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes in use: header, directory and heap (deleted records included)."""
+        return self._header()[1]
+
+    # Chains
+
+    def hash(self, key: str) -> int:
+        """Bucket index."""
+        return hash64(key) % self.size
+
+    def _record(self, offset: int):
+        self._ensure(offset + RECORD.size)
+        return RECORD.unpack_from(self._mm, offset)
+
+    def _find(self, key: bytes, h: int):
+        """
+        Walk the chain for a hash. Returns (offset, record, probes); offset
+        is 0 when the key is absent.
+        """
+        offset = SLOT.unpack_from(self._mm, HEADER_BYTES + SLOT.size * (h % self.size))[0]
+        probes = 1
+        while offset:
+            rec = self._record(offset)
+            nxt, rec_hash, klen, vlen, flags = rec
+            if not flags & DELETED and rec_hash == h and klen == len(key):
+                start = offset + RECORD.size
+                self._ensure(start + klen + vlen)
+                if self._mm[start:start + klen] == key:
+                    return offset, rec, probes
+            offset = nxt
+            probes += 1
+        return 0, None, probes
+
+    def _value(self, offset: int, rec) -> Any:
+        _, _, klen, vlen, _ = rec
+        start = offset + RECORD.size + klen
+        return self.decode(self._mm[start:start + vlen])
+
+    def _write(self, key: str, value: Any) -> Tuple[bool, int]:
+        """Upsert; returns (existed, probes)."""
+        if self.readonly:
+            raise PermissionError("Table was opened read-only")
+        kb = key.encode("utf-8")
+        vb = self.encode(value)
+        h = hash64(key)
+        old, _, probes = self._find(kb, h)
+        count, heap_end = self._header()
+        slot_at = HEADER_BYTES + SLOT.size * (h % self.size)
+
+        end = _align(heap_end + RECORD.size + len(kb) + len(vb))
+        self._reserve(end)
+        head = SLOT.unpack_from(self._mm, slot_at)[0]
+        RECORD.pack_into(self._mm, heap_end, head, h, len(kb), len(vb), 0)
+        body = heap_end + RECORD.size
+        self._mm[body:body + len(kb)] = kb
+        self._mm[body + len(kb):body + len(kb) + len(vb)] = vb
+        # Publish only once the record is complete
+        SLOT.pack_into(self._mm, slot_at, heap_end)
+        if old:
+            self._mm[old + RECORD.size - 1] = DELETED
+        self._set_header(count if old else count + 1, end)
+        return bool(old), probes
+
+    # SimpleHashTable API
+
+    def insert(self, key: str, value: Any) -> HashOperation:
+        """Insert a key, or overwrite its value."""
+        existed, probes = self._write(key, value)
+        op = HashOperation(
+            operation="insert",
+            key=key,
+            value=value,
+            hash_value=self.hash(key),
+            index=self.hash(key),
+            found=True,
+            collision=existed or probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def lookup(self, key: str) -> HashOperation:
+        """Look up a key, reading only its chain from the mapping."""
+        h = hash64(key)
+        offset, rec, probes = self._find(key.encode("utf-8"), h)
+        op = HashOperation(
+            operation="lookup",
+            key=key,
+            value=self._value(offset, rec) if offset else None,
+            hash_value=h % self.size,
+            index=h % self.size,
+            found=bool(offset),
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def delete(self, key: str) -> HashOperation:
+        """Flag a key's record as deleted (its bytes stay in the file)."""
+        if self.readonly:
+            raise PermissionError("Table was opened read-only")
+        h = hash64(key)
+        offset, rec, probes = self._find(key.encode("utf-8"), h)
+        value = None
+        if offset:
+            value = self._value(offset, rec)
+            self._mm[offset + RECORD.size - 1] = DELETED
+            count, heap_end = self._header()
+            self._set_header(count - 1, heap_end)
+        op = HashOperation(
+            operation="delete",
+            key=key,
+            value=value,
+            hash_value=h % self.size,
+            index=h % self.size,
+            found=bool(offset),
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def get(self, key: str, default: Any = None) -> Any:
+        offset, rec, _ = self._find(key.encode("utf-8"), hash64(key))
+        return self._value(offset, rec) if offset else default
+
+    def put(self, key: str, value: Any):
+        self._write(key, value)
+
+    def remove(self, key: str) -> bool:
+        return self.delete(key).found
+
+    def __contains__(self, key: str) -> bool:
+        return bool(self._find(key.encode("utf-8"), hash64(key))[0])
+
+    def __len__(self) -> int:
+        return self._header()[0]
+
+    def load_factor(self) -> float:
+        return len(self) / self.size
+
+    def get_distribution(self) -> List[int]:
+        """Live entries per bucket (walks every chain)."""
+        dist = []
+        for i in range(self.size):
+            offset = SLOT.unpack_from(self._mm, HEADER_BYTES + SLOT.size * i)[0]
+            count = 0
+            while offset:
+                nxt, _, _, _, flags = self._record(offset)
+                count += not flags & DELETED
+                offset = nxt
+            dist.append(count)
+        return dist
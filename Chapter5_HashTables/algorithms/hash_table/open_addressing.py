@@ -0,0 +1,257 @@
+"""
+Open-addressing hash tables (linear probing and Robin Hood).
+No Manim imports.
+"""
+from typing import Any, Callable, List, Optional
+from array import array
+from collections import deque
+
+from .logic import HashOperation, simple_hash, DEFAULT_TRACE_LIMIT
+
+
+EMPTY = -1
+DELETED = -2   # Tombstone: keeps probe chains intact after a delete
+
+
+class LinearProbingHashTable:
+    """
+    Keys, values and probe distances live in flat parallel arrays,
+    so an entry costs no tuple or chain list.
+
+    Deletes leave DELETED tombstones; once they exceed tombstone_limit * size
+    the table is rebuilt in place so lookups stop walking over them.
+    """
+    
+    def __init__(self, size: int = 10, max_load: float = 0.9,
+                 hash_fn: Callable[[str, int], int] = simple_hash,
+                 tombstone_limit: float = 0.2, trace: bool = False,
+                 trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
+        self.size = size
+        self.max_load = max_load
+        self.hash_fn = hash_fn
+        self.tombstone_limit = tombstone_limit
+        self.count = 0
+        self.tombstones = 0
+        self.trace = trace
+        self.operations = deque(maxlen=trace_limit)  # Recent operations for animation
+        self._allocate(size)
+    
+    def _allocate(self, size: int):
+        self.size = size
+        self.keys = [None] * size
+        self.values = [None] * size
+        self.dist = array('l', [EMPTY]) * size  # Displacement from home slot
+    
+    def hash(self, key: str) -> int:
+        """Compute hash value."""
+        return self.hash_fn(key, self.size)
+    
+    def _store(self, key: str, value: Any):
+        """Place an entry; returns (slot, probes, found_existing)."""
+        home = self.hash(key)
+        reuse = None
+        for d in range(self.size):
+            i = (home + d) % self.size
+            if self.dist[i] == DELETED:
+                if reuse is None:
+                    reuse = (i, d)
+                continue
+            if self.dist[i] == EMPTY:
+                break
+            if self.keys[i] == key:
+                self.values[i] = value
+                return i, d + 1, True
+        else:
+            if reuse is None:
+                raise RuntimeError("Hash table is full; use max_load < 1")
+        # Key is absent: take the first tombstone on the path, else the empty slot
+        if reuse is not None:
+            i, slot_d = reuse
+            self.tombstones -= 1
+        else:
+            slot_d = d
+        self.keys[i], self.values[i], self.dist[i] = key, value, slot_d
+        return i, d + 1, False
+    
+    def _locate(self, key: str):
+        """Returns (slot or EMPTY, probes)."""
+        home = self.hash(key)
+        for d in range(self.size):
+            i = (home + d) % self.size
+            if self.dist[i] == EMPTY:
+                return EMPTY, d + 1
+            if self.dist[i] != DELETED and self.keys[i] == key:
+                return i, d + 1
+        return EMPTY, self.size
+    
+    def _rebuild(self, new_size: int, operation: str):
+        """Rehash every live entry into fresh arrays (drops tombstones)."""
+        live = [(k, v) for k, v, d in zip(self.keys, self.values, self.dist) if d >= 0]
+        old_size = self.size
+        self._allocate(new_size)
+        self.tombstones = 0
+        for key, value in live:
+            self._store(key, value)
+        if self.trace:
+            self.operations.append(HashOperation(
+                operation=operation,
+                key="",
+                value=self.size,
+                hash_value=old_size,
+                index=-1,
+                found=False,
+                collision=False,
+                probes=0
+            ))
+    
+    def insert(self, key: str, value: Any) -> HashOperation:
+        """Insert or update a key-value pair."""
+        if (self.count + 1) / self.size > self.max_load:
+            self._rebuild(self.size * 2, "resize")
+        elif (self.count + self.tombstones + 1) / self.size > self.max_load:
+            # Mostly tombstones: same size is enough
+            self._rebuild(self.size, "compact")
+        h = self.hash(key)
+        idx, probes, existed = self._store(key, value)
+        if not existed:
+            self.count += 1
+        
+        op = HashOperation(
+            operation="insert",
+            key=key,
+            value=value,
+            hash_value=h,
+            index=idx,
+            found=True,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+    
+    def lookup(self, key: str) -> HashOperation:
+        """Look up a key."""
+        h = self.hash(key)
+        idx, probes = self._locate(key)
+        found = idx != EMPTY
+        
+        op = HashOperation(
+            operation="lookup",
+            key=key,
+            value=self.values[idx] if found else None,
+            hash_value=h,
+            index=idx if found else h,
+            found=found,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+    
+    def delete(self, key: str) -> HashOperation:
+        """Delete a key, leaving a tombstone in its slot."""
+        h = self.hash(key)
+        idx, probes = self._locate(key)
+        found = idx != EMPTY
+        value = None
+        if found:
+            value = self.values[idx]
+            self._remove(idx)
+            self.count -= 1
+        
+        op = HashOperation(
+            operation="delete",
+            key=key,
+            value=value,
+            hash_value=h,
+            index=idx if found else h,
+            found=found,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        if self.tombstones > self.tombstone_limit * self.size:
+            self._rebuild(self.size, "compact")
+        return op
+    
+    def _remove(self, i: int):
+        self.keys[i] = self.values[i] = None
+        self.dist[i] = DELETED
+        self.tombstones += 1
+    
+    def load_factor(self) -> float:
+        """Calculate current load factor."""
+        return self.count / self.size
+    
+    def get_distribution(self) -> List[int]:
+        """Get distribution of items per slot (0 or 1)."""
+        return [1 if d >= 0 else 0 for d in self.dist]
+    
+    def get_probe_histogram(self) -> List[int]:
+        """hist[d] = entries stored d slots past their home slot."""
+        hist = [0]
+        for d in self.dist:
+            if d < 0:
+                continue
+            if d >= len(hist):
+                hist.extend([0] * (d + 1 - len(hist)))
+            hist[d] += 1
+        return hist
+
+
+class RobinHoodHashTable(LinearProbingHashTable):
+    """
+    Linear probing where an inserting entry that is further from home
+    evicts a "richer" resident, keeping probe lengths tightly bunched.
+
+    Deletes use backward shifting instead of tombstones, which keeps the
+    early-exit lookup invariant intact and never needs compaction.
+    """
+    
+    def _store(self, key: str, value: Any):
+        home = self.hash(key)
+        d = 0
+        placed_at = None
+        probes = 0
+        while True:
+            i = (home + d) % self.size
+            if placed_at is None:
+                probes += 1
+            if self.dist[i] == EMPTY:
+                self.keys[i], self.values[i], self.dist[i] = key, value, d
+                return (i if placed_at is None else placed_at), probes, False
+            if placed_at is None and self.keys[i] == key:
+                self.values[i] = value
+                return i, probes, True
+            if self.dist[i] < d:
+                # Take from the rich: swap and keep inserting the evicted entry
+                key, self.keys[i] = self.keys[i], key
+                value, self.values[i] = self.values[i], value
+                d, self.dist[i] = self.dist[i], d
+                if placed_at is None:
+                    placed_at = i
+                home = (i - d) % self.size
+            d += 1
+    
+    def _locate(self, key: str):
+        home = self.hash(key)
+        for d in range(self.size):
+            i = (home + d) % self.size
+            # An entry closer to home than we are means the key is absent
+            if self.dist[i] == EMPTY or self.dist[i] < d:
+                return EMPTY, d + 1
+            if self.keys[i] == key:
+                return i, d + 1
+        return EMPTY, self.size
+    
+    def _remove(self, i: int):
+        # Pull each following displaced entry one slot back toward home
+        j = (i + 1) % self.size
+        while self.dist[j] > 0:
+            self.keys[i], self.values[i], self.dist[i] = self.keys[j], self.values[j], self.dist[j] - 1
+            i, j = j, (j + 1) % self.size
+        self.keys[i] = self.values[i] = None
+        self.dist[i] = EMPTY
@@ -0,0 +1,253 @@
+"""
+Minimal perfect hashing for static key sets (CHD-style hash and displace).
+No Manim imports.
+"""
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+import struct
+
+import numpy as np
+
+from .logic import HashOperation, hash64, fmix64, GOLDEN_GAMMA, MASK64
+from .batch_hash import batch_hash64, batch_fmix64
+
+
+MPH_MAGIC = b"MPH1"
+# magic, keys, buckets, fingerprint bytes per key
+MPH_HEADER = struct.Struct("<4sIIB")
+
+# Pilot high bit: the low bits are the slot itself (single-key buckets)
+DIRECT = 1 << 31
+MAX_PILOT_TRIES = 1 << 22
+
+# Skewed bucketing (as in PTHash): 60% of keys share 30% of the buckets,
+# so the crowded buckets are placed while most slots are still free
+DENSE_KEYS = int(0.6 * (1 << 32))
+DENSE_BUCKETS = 0.3
+
+
+def _dense_buckets(r: int) -> int:
+    return min(max(1, int(DENSE_BUCKETS * r)), r)
+
+
+def _bucket(h: int, r: int) -> int:
+    dense = _dense_buckets(r)
+    low = h & 0xFFFFFFFF
+    if (h >> 32) < DENSE_KEYS or dense == r:
+        return low % dense
+    return dense + low % (r - dense)
+
+
+def _slot(h: int, pilot: int, n: int) -> int:
+    if pilot & DIRECT:
+        return pilot & ~DIRECT
+    return fmix64(h ^ ((pilot * GOLDEN_GAMMA) & MASK64)) % n
+
+
+def _batch_bucket(h: np.ndarray, r: int) -> np.ndarray:
+    dense = _dense_buckets(r)
+    low = h & np.uint64(0xFFFFFFFF)
+    b = low % np.uint64(dense)
+    if dense < r:
+        sparse = (h >> np.uint64(32)) >= np.uint64(DENSE_KEYS)
+        b = np.where(sparse, np.uint64(dense) + low % np.uint64(r - dense), b)
+    return b.astype(np.int64)
+
+
+def _find_pilot(members: np.ndarray, taken: np.ndarray, n: int) -> int:
+    """Smallest pilot putting every member on a distinct free slot, tried in batches."""
+    start, batch = 0, 16
+    k = len(members)
+    while start < MAX_PILOT_TRIES:
+        pilots = np.arange(start, start + batch, dtype=np.uint64)
+        mixed = batch_fmix64(members[None, :] ^ (pilots[:, None] * np.uint64(GOLDEN_GAMMA)))
+        slots = np.sort((mixed % np.uint64(n)).astype(np.int64), axis=1)
+        ok = ~taken[slots].any(axis=1)
+        if k > 1:
+            ok &= (np.diff(slots, axis=1) != 0).all(axis=1)
+        hits = np.flatnonzero(ok)
+        if len(hits):
+            return start + int(hits[0])
+        start += batch
+        batch = min(batch * 4, 1 << 14)
+    raise RuntimeError("No pilot found; try a smaller bucket_size")
+
+
+class MinimalPerfectHash:
+    """
+    Maps each of n known keys to a distinct slot in 0..n-1.
+
+    Keys are split into (deliberately uneven) buckets by their hash64.
+    Buckets are placed largest first: each gets the smallest pilot whose
+    re-mixed hashes land all its keys on free slots. Single-key buckets
+    store their slot directly, so the last few free slots never need a
+    long search. A lookup is one hash64, one pilot read and one mix.
+
+    Optional 8/16-bit fingerprints per slot make unknown keys return -1
+    instead of an arbitrary slot (with 2^-bits false-positive odds).
+    """
+
+    def __init__(self, num_keys: int, pilots: np.ndarray,
+                 fingerprints: Optional[np.ndarray] = None):
+        self.num_keys = num_keys
+        self.num_buckets = len(pilots)
+        self.pilots = pilots                # uint32 per bucket
+        self.fingerprints = fingerprints    # uint8/uint16 per slot, or None
+
+    @classmethod
+    def build(cls, keys: Sequence[str], bucket_size: float = 4.0,
+              fingerprint_bits: int = 16) -> "MinimalPerfectHash":
+        """
+        Args:
+            keys: Distinct keys
+            bucket_size: Average keys per bucket (smaller builds faster,
+                         larger gives a smaller structure)
+            fingerprint_bits: 0, 8 or 16
+        """
+        if fingerprint_bits not in (0, 8, 16):
+            raise ValueError("fingerprint_bits must be 0, 8 or 16")
+        n = len(keys)
+        hashes = batch_hash64(keys)
+        if len(np.unique(hashes)) != n:
+            raise ValueError("Keys must be distinct (or two keys share a 64-bit hash)")
+        r = max(1, int(np.ceil(n / bucket_size)))
+        bucket_of = _batch_bucket(hashes, r)
+        by_bucket = np.argsort(bucket_of, kind="stable")
+        starts = np.searchsorted(bucket_of[by_bucket], np.arange(r + 1))
+        sizes = np.diff(starts)
+
+        pilots = np.zeros(r, dtype=np.uint32)
+        taken = np.zeros(n, dtype=bool)
+        for b in np.argsort(-sizes, kind="stable"):
+            if sizes[b] <= 1:
+                break
+            members = hashes[by_bucket[starts[b]:starts[b + 1]]]
+            pilot = _find_pilot(members, taken, n)
+            pilots[b] = pilot
+            for h in members:
+                taken[_slot(int(h), pilot, n)] = True
+
+        singles = np.flatnonzero(sizes == 1)
+        pilots[singles] = DIRECT | np.flatnonzero(~taken)[:len(singles)]
+
+        mph = cls(n, pilots)
+        if fingerprint_bits:
+            dtype = np.uint8 if fingerprint_bits == 8 else np.uint16
+            mask = np.uint64((1 << fingerprint_bits) - 1)
+            fingerprints = np.zeros(n, dtype=dtype)
+            fingerprints[mph._index_hashes(hashes)] = (hashes & mask).astype(dtype)
+            mph.fingerprints = fingerprints
+        return mph
+
+    def _index_hash(self, h: int) -> int:
+        return _slot(h, int(self.pilots[_bucket(h, self.num_buckets)]), self.num_keys)
+
+    def _index_hashes(self, h: np.ndarray) -> np.ndarray:
+        pilots = self.pilots[_batch_bucket(h, self.num_buckets)].astype(np.uint64)
+        mixed = batch_fmix64(h ^ (pilots * np.uint64(GOLDEN_GAMMA)))
+        slots = (mixed % np.uint64(self.num_keys)).astype(np.int64)
+        direct = (pilots & np.uint64(DIRECT)) != 0
+        slots[direct] = (pilots[direct] & np.uint64(DIRECT - 1)).astype(np.int64)
+        return slots
+
+    def index(self, key: str) -> int:
+        """Slot of a key, or -1 if the fingerprint rules it out."""
+        if self.num_keys == 0:
+            return -1
+        h = hash64(key)
+        slot = self._index_hash(h)
+        if self.fingerprints is not None:
+            mask = (1 << (8 * self.fingerprints.itemsize)) - 1
+            if self.fingerprints[slot] != h & mask:
+                return -1
+        return slot
+
+    def index_many(self, keys: Iterable[str]) -> np.ndarray:
+        """index() for many keys at once (int64, -1 for rejected keys)."""
+        h = batch_hash64(keys)
+        if self.num_keys == 0:
+            return np.full(len(h), -1, dtype=np.int64)
+        slots = self._index_hashes(h)
+        if self.fingerprints is not None:
+            mask = np.uint64((1 << (8 * self.fingerprints.itemsize)) - 1)
+            miss = self.fingerprints[slots] != (h & mask)
+            slots[miss] = -1
+        return slots
+
+    @property
+    def nbytes(self) -> int:
+        extra = self.fingerprints.nbytes if self.fingerprints is not None else 0
+        return MPH_HEADER.size + self.pilots.nbytes + extra
+
+    @property
+    def bits_per_key(self) -> float:
+        return 8 * self.nbytes / max(self.num_keys, 1)
+
+    def to_bytes(self) -> bytes:
+        fp_bytes = self.fingerprints.itemsize if self.fingerprints is not None else 0
+        header = MPH_HEADER.pack(MPH_MAGIC, self.num_keys, self.num_buckets, fp_bytes)
+        body = self.pilots.astype("<u4").tobytes()
+        if self.fingerprints is not None:
+            body += self.fingerprints.astype(self.fingerprints.dtype.newbyteorder("<")).tobytes()
+        return header + body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MinimalPerfectHash":
+        """Rebuild without copying: arrays are views onto `data`."""
+        magic, n, r, fp_bytes = MPH_HEADER.unpack_from(data)
+        if magic != MPH_MAGIC:
+            raise ValueError("Not a minimal perfect hash blob")
+        offset = MPH_HEADER.size
+        pilots = np.frombuffer(data, dtype="<u4", count=r, offset=offset)
+        fingerprints = None
+        if fp_bytes:
+            dtype = "<u1" if fp_bytes == 1 else "<u2"
+            fingerprints = np.frombuffer(data, dtype=dtype, count=n, offset=offset + 4 * r)
+        return cls(n, pilots, fingerprints)
+
+
+class PerfectHashTable:
+    """
+    Read-only table over a fixed key set: every lookup reads exactly one
+    slot, so there are no collisions and no chains.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, Any]], bucket_size: float = 4.0):
+        items = list(items)
+        self.mph = MinimalPerfectHash.build([k for k, _ in items], bucket_size,
+                                            fingerprint_bits=0)
+        self.size = len(items)
+        self.keys: List[Optional[str]] = [None] * self.size
+        self.values: List[Any] = [None] * self.size
+        for key, value in items:
+            slot = self.mph.index(key)
+            self.keys[slot], self.values[slot] = key, value
+
+    def lookup(self, key: str) -> HashOperation:
+        """Look up a key: always one probe."""
+        slot = self.mph.index(key)
+        found = slot >= 0 and self.keys[slot] == key
+        return HashOperation(
+            operation="lookup",
+            key=key,
+            value=self.values[slot] if found else None,
+            hash_value=slot,
+            index=slot,
+            found=found,
+            collision=False,
+            probes=1
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = self.mph.index(key)
+        return self.values[slot] if slot >= 0 and self.keys[slot] == key else default
+
+    def __contains__(self, key: str) -> bool:
+        slot = self.mph.index(key)
+        return slot >= 0 and self.keys[slot] == key
+
+    def __len__(self) -> int:
+        return self.size
+
+    def load_factor(self) -> float:
+        """Always 1.0: one slot per key."""
+        return 1.0 if self.size else 0.0
@@ -0,0 +1,287 @@
+"""
+Probabilistic structures built on the Chapter 5 hash functions:
+Bloom filter (membership), count-min sketch (frequencies) and
+HyperLogLog (distinct counts).
+No Manim imports.
+"""
+from typing import Iterable, Tuple
+import math
+
+import numpy as np
+
+from .logic import hash64, fmix64, GOLDEN_GAMMA, MASK64
+from .batch_hash import batch_hash64, batch_fmix64
+
+
+def hash_pair(key: str) -> Tuple[int, int]:
+    """
+    Two 64-bit hashes for double hashing: g_i = (h1 + i * h2) mod 2^64.
+    Both span 64 bits, so every position of a filter with more than 2^32
+    bits is reachable from h1 alone. h2 re-mixes h1 with a different
+    constant and is forced odd so it never collapses every g_i onto h1.
+    """
+    h1 = hash64(key)
+    return h1, fmix64(h1 ^ GOLDEN_GAMMA) | 1
+
+
+def batch_hash_pair(keys: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """hash_pair for many keys at once (uint64 arrays)."""
+    h1 = batch_hash64(keys)
+    return h1, batch_fmix64(h1 ^ np.uint64(GOLDEN_GAMMA)) | np.uint64(1)
+
+
+def _probe(h1: int, h2: int, i: int, m: int) -> int:
+    """g_i mod m, wrapping at 64 bits like the uint64 batch path."""
+    return ((h1 + i * h2) & MASK64) % m
+
+
+def _batch_probes(h1: np.ndarray, h2: np.ndarray, count: int, m: int) -> np.ndarray:
+    """(n, count) int64 positions g_i mod m."""
+    i = np.arange(count, dtype=np.uint64)
+    return ((h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(m)).astype(np.int64)
+
+
+def bloom_parameters(capacity: int, error_rate: float) -> Tuple[int, int]:
+    """Optimal (bits, hash count) for `capacity` keys at a target false-positive rate."""
+    if not 0 < error_rate < 1:
+        raise ValueError("error_rate must be between 0 and 1")
+    capacity = max(capacity, 1)
+    bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+class BloomFilter:
+    """
+    Set membership in a packed bit array. `key in bloom` is never wrong
+    for added keys, and wrong for others with probability ~error_rate
+    while at most `capacity` keys have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits, self.num_hashes = bloom_parameters(capacity, error_rate)
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0   # Keys added (including repeats)
+
+    @property
+    def nbytes(self) -> int:
+        return self.bits.nbytes
+
+    def _positions(self, key: str):
+        h1, h2 = hash_pair(key)
+        return [_probe(h1, h2, i, self.num_bits) for i in range(self.num_hashes)]
+
+    def _batch_positions(self, keys) -> np.ndarray:
+        """(n, num_hashes) bit positions."""
+        return _batch_probes(*batch_hash_pair(keys), self.num_hashes, self.num_bits)
+
+    def add(self, key: str):
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] >> (p & 7) & 1 for p in self._positions(key))
+
+    def check_and_add(self, key: str) -> bool:
+        """Duplicate check: True if the key was (probably) seen before."""
+        seen = key in self
+        if not seen:
+            self.add(key)
+        return seen
+
+    def add_many(self, keys: Iterable[str]):
+        keys = list(keys)
+        if not keys:
+            return
+        pos = self._batch_positions(keys).ravel()
+        np.bitwise_or.at(self.bits, pos >> 3, (1 << (pos & 7)).astype(np.uint8))
+        self.count += len(keys)
+
+    def contains_many(self, keys: Iterable[str]) -> np.ndarray:
+        keys = list(keys)
+        if not keys:
+            return np.zeros(0, dtype=bool)
+        pos = self._batch_positions(keys)
+        return ((self.bits[pos >> 3] >> (pos & 7)) & 1).all(axis=1).astype(bool)
+
+    def fill_ratio(self) -> float:
+        """Fraction of bits set."""
+        return float(np.unpackbits(self.bits)[:self.num_bits].mean())
+
+    def false_positive_rate(self) -> float:
+        """Expected false-positive rate at the current count."""
+        return (1.0 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class CountMinSketch:
+    """
+    Approximate counts in a depth x width counter grid. Estimates never
+    undercount; with probability 1 - delta they overcount by at most
+    epsilon * total.
+
+    conservative=True only raises the counters that are at the current
+    minimum, which tightens estimates for skewed data.
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01,
+                 conservative: bool = False):
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1.0 / delta))
+        self.conservative = conservative
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+    def _columns(self, key: str):
+        h1, h2 = hash_pair(key)
+        return [_probe(h1, h2, row, self.width) for row in range(self.depth)]
+
+    def add(self, key: str, count: int = 1):
+        cols = self._columns(key)
+        rows = range(self.depth)
+        if self.conservative:
+            target = min(self.table[r, c] for r, c in zip(rows, cols)) + count
+            for r, c in zip(rows, cols):
+                self.table[r, c] = max(self.table[r, c], target)
+        else:
+            for r, c in zip(rows, cols):
+                self.table[r, c] += count
+        self.total += count
+
+    def estimate(self, key: str) -> int:
+        return int(min(self.table[r, c] for r, c in enumerate(self._columns(key))))
+
+    def add_many(self, keys: Iterable[str]):
+        """Count every key once (repeats add up); always a plain update."""
+        keys = list(keys)
+        if not keys:
+            return
+        cols = _batch_probes(*batch_hash_pair(keys), self.depth, self.width)
+        for row in range(self.depth):
+            np.add.at(self.table[row], cols[:, row], 1)
+        self.total += len(keys)
+
+    def estimate_many(self, keys: Iterable[str]) -> np.ndarray:
+        cols = _batch_probes(*batch_hash_pair(keys), self.depth, self.width)
+        rows = np.arange(self.depth, dtype=np.int64)
+        return self.table[rows[None, :], cols].min(axis=1)
+
+
+def _bit_length64(x: np.ndarray) -> np.ndarray:
+    """int.bit_length for a uint64 array, by halving (exact, unlike log2)."""
+    x = x.copy()
+    n = np.zeros(len(x), dtype=np.int64)
+    for s in (32, 16, 8, 4, 2, 1):
+        big = x >= np.uint64(1 << s)
+        n += s * big
+        x = np.where(big, x >> np.uint64(s), x)
+    return n + (x > 0)
+
+
+def _sigma(x: float) -> float:
+    if x == 1.0:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        z_old = z
+        z += x * y
+        y += y
+        if z == z_old:
+            return z
+
+
+def _tau(x: float) -> float:
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y, z = 1.0, 1.0 - x
+    while True:
+        x = math.sqrt(x)
+        z_old = z
+        y *= 0.5
+        z -= (1.0 - x) ** 2 * y
+        if z == z_old:
+            return z / 3.0
+
+
+class HyperLogLog:
+    """
+    Distinct-count estimate in 2^precision one-byte registers, with a
+    standard error of about 1.04 / sqrt(2^precision) (0.8% at the default).
+
+    Each key's hash64 picks a register with its top `precision` bits and
+    stores the longest run of leading zeros seen in the rest. Sketches with
+    the same precision merge by taking register-wise maxima.
+
+    count() uses Ertl's improved estimator ("New cardinality estimation
+    algorithms for HyperLogLog sketches", 2017), which corrects the small-
+    and large-range bias of the original formula without empirical tables.
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = np.zeros(self.num_registers, dtype=np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        return self.registers.nbytes
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(self.num_registers)
+
+    def add(self, key: str):
+        h = hash64(key)
+        q = 64 - self.precision
+        idx = h >> q
+        rank = q - (h & ((1 << q) - 1)).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def add_many(self, keys: Iterable[str]):
+        h = batch_hash64(keys)
+        if not len(h):
+            return
+        q = 64 - self.precision
+        idx = (h >> np.uint64(q)).astype(np.int64)
+        rest = h & np.uint64((1 << q) - 1)
+        rank = (q - _bit_length64(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Fold another sketch into this one (union of the two streams)."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> float:
+        m = self.num_registers
+        q = 64 - self.precision
+        c = np.bincount(self.registers, minlength=q + 2)
+        z = m * _tau(1.0 - c[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + c[k])
+        z += m * _sigma(c[0] / m)
+        return m * m / (2.0 * math.log(2) * z)
+
+    def __len__(self) -> int:
+        return int(round(self.count()))
+
+    def to_bytes(self) -> bytes:
+        return bytes([self.precision]) + self.registers.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        sketch = cls(data[0])
+        sketch.registers[:] = np.frombuffer(data, dtype=np.uint8, offset=1)
+        return sketch
@@ -0,0 +1,276 @@
+"""
+Swiss-table style hash table: 1-byte control tags probed 16 at a time.
+No Manim imports.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from collections import deque
+
+import numpy as np
+
+from .logic import (
+    HashOperation, simple_hash, fnv1a_hash, multiply_shift_hash, DEFAULT_TRACE_LIMIT
+)
+from .batch_hash import batch_simple_hash, batch_fnv1a_hash, batch_multiply_shift_hash
+
+
+GROUP_WIDTH = 16
+HASH_RANGE = 1 << 32
+
+# Control byte states; full slots hold the 7-bit H2 tag (0..127)
+CTRL_EMPTY = 0x80
+CTRL_DELETED = 0xFE
+
+# Vectorized twins used by lookup_many
+BATCH_HASHES: Dict[Callable, Callable] = {
+    simple_hash: batch_simple_hash,
+    fnv1a_hash: batch_fnv1a_hash,
+    multiply_shift_hash: batch_multiply_shift_hash,
+}
+
+
+class SwissHashTable:
+    """
+    Open addressing over groups of 16 slots with a parallel array of
+    control bytes. A key's hash splits into H1 (which group to start at)
+    and H2 (a 7-bit tag). A lookup compares H2 against a whole group of
+    control bytes at once and only touches keys whose tag matches; a group
+    with an EMPTY byte ends the probe.
+
+    Groups are visited in triangular order, which covers every group when
+    the group count is a power of two.
+    """
+
+    def __init__(self, size: int = 16, max_load: float = 0.875,
+                 hash_fn: Callable[[str, int], int] = fnv1a_hash,
+                 trace: bool = False, trace_limit: Optional[int] = DEFAULT_TRACE_LIMIT):
+        self.max_load = max_load
+        self.hash_fn = hash_fn
+        self.count = 0
+        self.tombstones = 0
+        self.trace = trace
+        self.operations = deque(maxlen=trace_limit)  # Recent operations for animation
+        groups = 1
+        while groups * GROUP_WIDTH < size:
+            groups *= 2
+        self._allocate(groups)
+
+    def _allocate(self, groups: int):
+        self.groups = groups
+        self.size = groups * GROUP_WIDTH
+        self.ctrl = np.full(self.size, CTRL_EMPTY, dtype=np.uint8)
+        self.keys: List[Optional[str]] = [None] * self.size
+        self.values: List[Any] = [None] * self.size
+        self._group_view = self.ctrl.reshape(groups, GROUP_WIDTH)
+
+    def hash(self, key: str) -> int:
+        """Full 32-bit hash (H1 = hash >> 7, H2 = hash & 0x7F)."""
+        return self.hash_fn(key, HASH_RANGE)
+
+    def _probe(self, h: int):
+        """Group indices in triangular probe order."""
+        mask = self.groups - 1
+        g = (h >> 7) & mask
+        for step in range(1, self.groups + 1):
+            yield g
+            g = (g + step) & mask
+
+    def _find(self, key: str, h: int):
+        """Returns (slot or -1, groups probed)."""
+        tag = h & 0x7F
+        for probes, g in enumerate(self._probe(h), start=1):
+            group = self._group_view[g]
+            base = g * GROUP_WIDTH
+            for offset in np.flatnonzero(group == tag):
+                if self.keys[base + offset] == key:
+                    return base + int(offset), probes
+            if (group == CTRL_EMPTY).any():
+                return -1, probes
+        return -1, self.groups
+
+    def _free_slot(self, h: int):
+        """First EMPTY or DELETED slot on the probe path: (slot, groups probed)."""
+        for probes, g in enumerate(self._probe(h), start=1):
+            free = np.flatnonzero(self._group_view[g] >= CTRL_EMPTY)
+            if len(free):
+                return g * GROUP_WIDTH + int(free[0]), probes
+        raise RuntimeError("Swiss table is full")
+
+    def _store(self, key: str, value: Any, h: int):
+        """Returns (slot, groups probed)."""
+        slot, probes = self._free_slot(h)
+        if self.ctrl[slot] == CTRL_DELETED:
+            self.tombstones -= 1
+        self.ctrl[slot] = h & 0x7F
+        self.keys[slot], self.values[slot] = key, value
+        return slot, probes
+
+    def _rebuild(self, groups: int, operation: str):
+        live = [(k, v) for k, v, c in zip(self.keys, self.values, self.ctrl) if c < CTRL_EMPTY]
+        old_size = self.size
+        self._allocate(groups)
+        self.tombstones = 0
+        for key, value in live:
+            self._store(key, value, self.hash(key))
+        if self.trace:
+            self.operations.append(HashOperation(
+                operation=operation,
+                key="",
+                value=self.size,
+                hash_value=old_size,
+                index=-1,
+                found=False,
+                collision=False,
+                probes=0
+            ))
+
+    def _reserve(self):
+        """Keep count + tombstones under max_load before adding one more entry."""
+        if (self.count + self.tombstones + 1) > self.max_load * self.size:
+            if (self.count + 1) > self.max_load * self.size / 2:
+                self._rebuild(self.groups * 2, "resize")
+            else:
+                self._rebuild(self.groups, "compact")
+
+    def insert(self, key: str, value: Any) -> HashOperation:
+        """Insert or update a key-value pair."""
+        h = self.hash(key)
+        slot, probes = self._find(key, h)
+        found = slot >= 0
+        if found:
+            self.values[slot] = value
+        else:
+            self._reserve()
+            slot, probes = self._store(key, value, h)
+            self.count += 1
+
+        op = HashOperation(
+            operation="insert",
+            key=key,
+            value=value,
+            hash_value=h,
+            index=slot,
+            found=True,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def lookup(self, key: str) -> HashOperation:
+        """Look up a key; probes counts groups scanned."""
+        h = self.hash(key)
+        slot, probes = self._find(key, h)
+        found = slot >= 0
+
+        op = HashOperation(
+            operation="lookup",
+            key=key,
+            value=self.values[slot] if found else None,
+            hash_value=h,
+            index=slot,
+            found=found,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def delete(self, key: str) -> HashOperation:
+        """
+        Delete a key. The slot goes back to EMPTY when its group still has
+        an EMPTY byte (no probe ever passed through it), else DELETED.
+        """
+        h = self.hash(key)
+        slot, probes = self._find(key, h)
+        found = slot >= 0
+        value = None
+        if found:
+            value = self.values[slot]
+            self.keys[slot] = self.values[slot] = None
+            group = self._group_view[slot // GROUP_WIDTH]
+            if (group == CTRL_EMPTY).any():
+                self.ctrl[slot] = CTRL_EMPTY
+            else:
+                self.ctrl[slot] = CTRL_DELETED
+                self.tombstones += 1
+            self.count -= 1
+
+        op = HashOperation(
+            operation="delete",
+            key=key,
+            value=value,
+            hash_value=h,
+            index=slot,
+            found=found,
+            collision=probes > 1,
+            probes=probes
+        )
+        if self.trace:
+            self.operations.append(op)
+        return op
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value for key, or default, without recording an operation."""
+        slot, _ = self._find(key, self.hash(key))
+        return self.values[slot] if slot >= 0 else default
+
+    def put(self, key: str, value: Any):
+        """Insert or overwrite without recording an operation."""
+        h = self.hash(key)
+        slot, _ = self._find(key, h)
+        if slot >= 0:
+            self.values[slot] = value
+            return
+        self._reserve()
+        self._store(key, value, h)
+        self.count += 1
+
+    def lookup_many(self, keys: Sequence[str], default: Any = None) -> List[Any]:
+        """
+        Batched get(): hashes every key with NumPy, then runs the probe
+        rounds for all unresolved keys at once, one (n, 16) tag comparison
+        per round. Only tag matches are checked in Python.
+        """
+        keys = list(keys)
+        batch = BATCH_HASHES.get(self.hash_fn)
+        if batch is not None:
+            h = batch(keys, HASH_RANGE)
+        else:
+            h = np.fromiter((self.hash(k) for k in keys), dtype=np.int64, count=len(keys))
+        mask = self.groups - 1
+        groups = (h >> 7) & mask
+        tags = (h & 0x7F).astype(np.uint8)
+        results = [default] * len(keys)
+        active = np.arange(len(keys))
+
+        for step in range(1, self.groups + 1):
+            if not len(active):
+                break
+            ctrl = self._group_view[groups[active]]
+            done = (ctrl == CTRL_EMPTY).any(axis=1)
+            rows, offsets = np.nonzero(ctrl == tags[active, None])
+            slots = groups[active[rows]] * GROUP_WIDTH + offsets
+            for row, slot in zip(rows.tolist(), slots.tolist()):
+                i = active[row]
+                if self.keys[slot] == keys[i]:
+                    results[i] = self.values[slot]
+                    done[row] = True
+            active = active[~done]
+            groups[active] = (groups[active] + step) & mask
+        return results
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key, self.hash(key))[0] >= 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def load_factor(self) -> float:
+        """Calculate current load factor."""
+        return self.count / self.size
+
+    def get_distribution(self) -> List[int]:
+        """Full slots per group."""
+        return (self._group_view < CTRL_EMPTY).sum(axis=1).tolist()
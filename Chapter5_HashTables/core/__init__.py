@@ -1,2 +1,2 @@
 """Core visual components package."""
-from .hash_table_view import HashCellView, HashTableView, HashFunctionView, LinkedListNodeView
+from .hash_table_view import HashCellView, HashTableView, HashHeatmapView, HashFunctionView, LinkedListNodeView
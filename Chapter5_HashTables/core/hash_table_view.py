@@ -2,12 +2,16 @@
 Hash table visualization components.
 """
 from manim import *
+import math
 import sys
+
+import numpy as np
 sys.path.insert(0, '/home/hg/Desktop/algorthims/Chapter5_HashTables')
 
 from config.colors import (
     CELL_EMPTY, CELL_FILLED, CELL_HIGHLIGHT, TEXT_PRIMARY,
-    KEY_COLOR, VALUE_COLOR, LINKED_LIST, HASH_FUNCTION
+    KEY_COLOR, VALUE_COLOR, LINKED_LIST, HASH_FUNCTION,
+    LOAD_LOW, LOAD_MED, LOAD_HIGH
 )
 from config.fonts import LABEL_SIZE, SMALL_SIZE, TINY_SIZE
 
@@ -85,6 +89,72 @@ class HashTableView(VGroup):
         cell.set_content(key, value)
 
 
+def _rgba(hex_color):
+    """'#RRGGBB' -> [r, g, b, 255]."""
+    return [int(hex_color[i:i + 2], 16) for i in (1, 3, 5)] + [255]
+
+
+class HashHeatmapView(Group):
+    """
+    Bucket occupancy of a large table as one image, one pixel per slot.
+
+    Pixels are colored by chain length (empty, 1, 2, 3+) and laid out in
+    rows of `columns`. Redrawing only rewrites the pixel array, so a
+    10k-slot table updates every frame where per-slot HashCellViews
+    would not.
+    """
+    
+    def __init__(self, slots=10_000, height=3.0, aspect=16 / 9,
+                 palette=(CELL_EMPTY, LOAD_LOW, LOAD_MED, LOAD_HIGH)):
+        super().__init__()
+        self.aspect = aspect
+        self.palette = np.array([_rgba(c) for c in palette], dtype=np.uint8)
+        self.slots = slots
+        
+        self.image = ImageMobject(self._pixels(np.zeros(slots, dtype=np.int64)))
+        self.image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        self.image.height = height
+        self.add(self.image)
+    
+    def _pixels(self, dist):
+        """(rows, columns, 4) RGBA; padding past the last slot is transparent."""
+        n = len(dist)
+        columns = max(1, math.ceil(math.sqrt(n * self.aspect)))
+        rows = math.ceil(n / columns)
+        levels = np.minimum(np.asarray(dist, dtype=np.int64), len(self.palette) - 1)
+        pixels = np.zeros((rows * columns, 4), dtype=np.uint8)
+        pixels[:n] = self.palette[levels]
+        return pixels.reshape(rows, columns, 4)
+    
+    def set_distribution(self, dist):
+        """Redraw from a get_distribution() list (its length may change on resize)."""
+        self.slots = len(dist)
+        self.image.pixel_array = self._pixels(dist)
+        return self
+    
+    def track(self, table):
+        """Redraw from `table` every frame."""
+        self.add_updater(lambda m: m.set_distribution(table.get_distribution()))
+        return self
+    
+    def fill(self, table, items, **kwargs):
+        """
+        Animation that puts `items` into `table` as it plays, spread
+        evenly over the run time, redrawing after each frame's batch.
+        """
+        items = list(items)
+        done = [0]
+        
+        def update(m, alpha):
+            target = int(alpha * len(items))
+            for key, value in items[done[0]:target]:
+                table.put(key, value)
+            done[0] = target
+            m.set_distribution(table.get_distribution())
+        
+        return UpdateFromAlphaFunc(self, update, **kwargs)
+
+
 class HashFunctionView(VGroup):
     """Visual hash function box."""
     
@@ -0,0 +1,47 @@
+"""Bounded-load consistent hashing: loads stay consistent and capped."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.hash_table import BoundedLoadRing
+
+
+def _check(ring):
+    counted = {node: 0 for node in ring.weights}
+    for node in ring.assignments.values():
+        counted[node] += 1
+    assert ring.loads == counted
+    assert max(ring.loads.values()) <= ring.capacity(extra=0)
+
+
+def _ring(keys=5000):
+    ring = BoundedLoadRing([f"node-{i}" for i in range(8)], vnodes=50, epsilon=0.25)
+    for i in range(keys):
+        ring.assign(f"key-{i}")
+    return ring
+
+
+def test_join_and_leave_keep_loads_capped():
+    ring = _ring()
+    _check(ring)
+    ring.add_node("node-8")
+    _check(ring)
+    assert ring.loads["node-8"] > 0
+    ring.remove_node("node-3")
+    _check(ring)
+    assert len(ring.assignments) == 5000
+
+
+def test_removing_last_node_with_keys_leaves_ring_intact():
+    ring = BoundedLoadRing(["only"], vnodes=10)
+    ring.assign("key")
+    with pytest.raises(LookupError):
+        ring.remove_node("only")
+    assert ring.nodes == ["only"] and ring.assignments == {"key": "only"}
+    assert ring.node_for("key") == "only"
+    ring.release("key")
+    ring.remove_node("only")
+    assert len(ring) == 0
@@ -0,0 +1,41 @@
+"""Cuckoo rehashing: fresh salts must change which keys share a slot."""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.hash_table import CuckooHashTable
+
+
+def _colliding_pairs(table, keys, t):
+    slots = {}
+    for key in keys:
+        slots.setdefault(table.hash(key, t), []).append(key)
+    return {(a, b) for group in slots.values() for a in group for b in group if a < b}
+
+
+def test_same_size_rehash_changes_collisions():
+    table = CuckooHashTable(size=64)
+    keys = [f"key-{i}" for i in range(40)]
+    before = [_colliding_pairs(table, keys, t) for t in (0, 1)]
+    table._rehash(table.size)
+    assert table.size == 64
+    after = [_colliding_pairs(table, keys, t) for t in (0, 1)]
+    for t in (0, 1):
+        assert before[t] and after[t]
+        assert before[t] != after[t]
+
+
+def test_matches_dict_through_rehashes():
+    rng = random.Random(0)
+    table, ref = CuckooHashTable(), {}
+    for n in range(20_000):
+        key = f"k{rng.randrange(2000)}"
+        if rng.random() < 0.6:
+            table.insert(key, n)
+            ref[key] = n
+        else:
+            assert table.lookup(key).value == ref.get(key)
+    assert len(table) == len(ref)
+    assert all(table.lookup(k).value == v for k, v in ref.items())
@@ -0,0 +1,33 @@
+"""Incremental resizing: no single insert pays for the whole table."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.hash_table import SimpleHashTable, fnv1a_hash
+
+
+def test_bounded_work_per_insert_across_resize():
+    size = 1 << 14
+    table = SimpleHashTable(size=size, auto_resize=True, max_load=0.7, hash_fn=fnv1a_hash)
+    # Past one doubling, plus enough operations to finish migrating
+    keys = [f"key-{i}" for i in range(int(0.7 * size) + size // table.rehash_step + 1000)]
+
+    resizes = 0
+    for key in keys:
+        was_rehashing = table.rehashing
+        pos, old_size, current = table._rehash_pos, table._old_size, table.size
+        table.insert(key, 1)
+
+        if was_rehashing:
+            done = table._rehash_pos if table.rehashing else old_size
+            assert done - pos <= table.rehash_step
+        if table.size != current:
+            resizes += 1
+            # The resizing insert allocates flat lists only: no chain list per bucket
+            assert table.chains.count(None) == table.size
+            assert table._rehash_pos == 0
+
+    assert resizes == 1
+    assert table.size == size * 2 and not table.rehashing
+    assert sum(table.get_distribution()) == len(keys)
@@ -3,3 +3,5 @@ from .logic import (
     bfs_steps, BFSState, is_mango_seller,
     MANGO_SELLER_GRAPH, POKER_GRAPH, MORNING_ROUTINE, BFS_COMPLEXITY
 )
+from .batch import multi_source_bfs, bfs_distances, build_csr, BatchBFSResult, CSRArrays
+from .loader import CSRGraph, load_edge_list, save_snapshot, open_snapshot
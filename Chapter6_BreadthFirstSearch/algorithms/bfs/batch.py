@@ -0,0 +1,174 @@
+"""
+Batched multi-source BFS over a shared CSR graph.
+No Manim imports.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .loader import CSRGraph
+
+
+UNREACHABLE = -1
+
+
+@dataclass
+class CSRArrays:
+    """Compressed sparse row form of an adjacency list."""
+    nodes: List[str]
+    indptr: np.ndarray   # int64, len(nodes) + 1
+    indices: np.ndarray  # int32, one entry per edge
+
+    @property
+    def index(self) -> Dict[str, int]:
+        return {name: i for i, name in enumerate(self.nodes)}
+
+
+@dataclass
+class BatchBFSResult:
+    """Hop distances from many sources at once."""
+    sources: List[str]
+    nodes: List[str]
+    distances: np.ndarray  # int32 (len(sources), len(nodes)), -1 = unreachable
+
+    def distances_from(self, source: str) -> Dict[str, int]:
+        """Distance map for one source, reachable nodes only."""
+        row = self.distances[self.sources.index(source)]
+        return {self.nodes[i]: int(d) for i, d in enumerate(row) if d != UNREACHABLE}
+
+
+def build_csr(graph: Dict[str, List[str]]) -> CSRArrays:
+    """Convert an adjacency list into CSR arrays."""
+    if isinstance(graph, CSRGraph):
+        # Loaded snapshots are already CSR; reuse the (memory-mapped) arrays
+        return CSRArrays(graph.nodes, graph.indptr, graph.indices)
+
+    nodes = list(graph)
+    index = {name: i for i, name in enumerate(nodes)}
+    # Nodes that only appear as neighbors still get a row
+    for neighbors in graph.values():
+        for neighbor in neighbors:
+            if neighbor not in index:
+                index[neighbor] = len(nodes)
+                nodes.append(neighbor)
+
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    targets = []
+    for i, name in enumerate(nodes):
+        neighbors = graph.get(name, [])
+        targets.extend(index[n] for n in neighbors)
+        indptr[i + 1] = indptr[i] + len(neighbors)
+
+    return CSRArrays(nodes, indptr, np.asarray(targets, dtype=np.int32))
+
+
+def bfs_distances(indptr: np.ndarray, indices: np.ndarray, source: int) -> np.ndarray:
+    """Level-synchronous BFS from one source, vectorized per frontier."""
+    n = len(indptr) - 1
+    dist = np.full(n, UNREACHABLE, dtype=np.int32)
+    dist[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+
+    while frontier.size:
+        level += 1
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+
+        # Gather every neighbor of the frontier in one indexing pass
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        neighbors = indices[offsets + np.arange(total)]
+        neighbors = np.unique(neighbors[dist[neighbors] == UNREACHABLE])
+
+        dist[neighbors] = level
+        frontier = neighbors.astype(np.int64)
+
+    return dist
+
+
+# Worker-side view of the shared CSR buffer
+_shared = {}
+
+
+def _attach(shm_name: str, n_nodes: int, n_edges: int):
+    """Pool initializer: map the CSR buffer read-only."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    indptr = np.ndarray((n_nodes + 1,), dtype=np.int64, buffer=shm.buf)
+    indices = np.ndarray((n_edges,), dtype=np.int32, buffer=shm.buf,
+                         offset=indptr.nbytes)
+    indptr.flags.writeable = False
+    indices.flags.writeable = False
+    _shared.update(shm=shm, indptr=indptr, indices=indices)
+
+
+def _run_shard(start: int, sources: Sequence[int]) -> Tuple[int, np.ndarray]:
+    """Compute a block of rows of the distance matrix."""
+    indptr, indices = _shared["indptr"], _shared["indices"]
+    block = np.empty((len(sources), len(indptr) - 1), dtype=np.int32)
+    for row, source in enumerate(sources):
+        block[row] = bfs_distances(indptr, indices, source)
+    return start, block
+
+
+def multi_source_bfs(
+    graph: Dict[str, List[str]],
+    sources: Sequence[str],
+    workers: Optional[int] = None,
+    shard_size: int = 64
+) -> BatchBFSResult:
+    """
+    Hop distances from every source to every node.
+
+    Args:
+        graph: Adjacency list or loaded CSRGraph
+        sources: Source nodes, one matrix row each
+        workers: Process count (None = CPU count, 1 = run in-process)
+        shard_size: Sources handed to a worker per task
+
+    Returns:
+        BatchBFSResult with an int32 distance matrix
+    """
+    csr = build_csr(graph)
+    index = csr.index
+    missing = [s for s in sources if s not in index]
+    if missing:
+        raise KeyError(f"Unknown source nodes: {missing[:5]}")
+
+    source_ids = [index[s] for s in sources]
+    distances = np.empty((len(source_ids), len(csr.nodes)), dtype=np.int32)
+
+    if workers == 1 or len(source_ids) <= shard_size:
+        for row, source in enumerate(source_ids):
+            distances[row] = bfs_distances(csr.indptr, csr.indices, source)
+        return BatchBFSResult(list(sources), csr.nodes, distances)
+
+    indptr = np.ascontiguousarray(csr.indptr, dtype=np.int64)
+    indices = np.ascontiguousarray(csr.indices, dtype=np.int32)
+    shm = shared_memory.SharedMemory(create=True, size=max(indptr.nbytes + indices.nbytes, 1))
+    try:
+        shm.buf[:indptr.nbytes] = indptr.tobytes()
+        shm.buf[indptr.nbytes:indptr.nbytes + indices.nbytes] = indices.tobytes()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(shm.name, len(csr.nodes), len(indices))
+        ) as pool:
+            futures = [
+                pool.submit(_run_shard, start, source_ids[start:start + shard_size])
+                for start in range(0, len(source_ids), shard_size)
+            ]
+            for future in futures:
+                start, block = future.result()
+                distances[start:start + len(block)] = block
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return BatchBFSResult(list(sources), csr.nodes, distances)
@@ -0,0 +1,166 @@
+"""
+Streaming edge-list loader with memory-mapped CSR snapshots.
+No Manim imports.
+"""
+from typing import Dict, Iterator, List, Optional
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+
+SNAPSHOT_FILES = ("indptr.npy", "indices.npy", "names.npy", "name_offsets.npy")
+
+
+class CSRGraph(Mapping):
+    """
+    Read-only adjacency list backed by CSR arrays.
+    Behaves like {node: [neighbors]} so bfs_steps can take it directly.
+    """
+
+    def __init__(self, indptr, indices, names, name_offsets):
+        self.indptr = indptr              # int64, one entry per node + 1
+        self.indices = indices            # int32 neighbor ids
+        self._names = names               # uint8 UTF-8 blob of all node names
+        self._name_offsets = name_offsets  # int64, one entry per node + 1
+        self._index: Optional[Dict[str, int]] = None
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    @property
+    def nodes(self) -> List[str]:
+        return [self.name(i) for i in range(self.num_nodes)]
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Name -> id, built on first use so opening a snapshot stays cheap."""
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self)}
+        return self._index
+
+    def name(self, i: int) -> str:
+        start, end = self._name_offsets[i], self._name_offsets[i + 1]
+        return bytes(self._names[start:end]).decode("utf-8")
+
+    def neighbor_ids(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def __getitem__(self, node: str) -> List[str]:
+        return [self.name(j) for j in self.neighbor_ids(self.index[node])]
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.num_nodes):
+            yield self.name(i)
+
+    def __len__(self) -> int:
+        return self.num_nodes
+
+    def __contains__(self, node) -> bool:
+        return node in self.index
+
+
+def load_edge_list(
+    path,
+    delimiter: Optional[str] = None,
+    directed: bool = True,
+    skip_header: bool = False,
+    chunk_size: int = 100_000
+) -> CSRGraph:
+    """
+    Stream an edge list ("src dst" per line) into a CSRGraph.
+
+    Args:
+        path: Text file, whitespace separated or CSV
+        delimiter: Field separator (None = auto-detect comma, else whitespace)
+        directed: If False, every edge is added in both directions
+        skip_header: Ignore the first non-comment line
+        chunk_size: Edges buffered before flushing to a NumPy chunk
+
+    Returns:
+        CSRGraph with nodes numbered in first-seen order
+    """
+    index: Dict[str, int] = {}
+    names: List[str] = []
+    src_chunks, dst_chunks = [], []
+    src_buf, dst_buf = [], []
+
+    def intern(name: str) -> int:
+        i = index.get(name)
+        if i is None:
+            i = index[name] = len(names)
+            names.append(name)
+        return i
+
+    def flush():
+        if src_buf:
+            src_chunks.append(np.array(src_buf, dtype=np.int32))
+            dst_chunks.append(np.array(dst_buf, dtype=np.int32))
+            src_buf.clear()
+            dst_buf.clear()
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if delimiter is None:
+                delimiter = "," if "," in line else ""
+            if skip_header:
+                skip_header = False
+                continue
+
+            fields = [p.strip() for p in line.split(delimiter or None)]
+            if len(fields) < 2:
+                raise ValueError(f"Malformed edge line: {line!r}")
+            u, v = intern(fields[0]), intern(fields[1])
+            src_buf.append(u)
+            dst_buf.append(v)
+            if not directed:
+                src_buf.append(v)
+                dst_buf.append(u)
+            if len(src_buf) >= chunk_size:
+                flush()
+    flush()
+
+    src = np.concatenate(src_chunks) if src_chunks else np.empty(0, dtype=np.int32)
+    dst = np.concatenate(dst_chunks) if dst_chunks else np.empty(0, dtype=np.int32)
+    return _from_edges(names, src, dst)
+
+
+def _from_edges(names: List[str], src: np.ndarray, dst: np.ndarray) -> CSRGraph:
+    """Group edges by source (stable, so file order is kept per node)."""
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=len(names)), out=indptr[1:])
+
+    encoded = [n.encode("utf-8") for n in names]
+    name_offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=name_offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    graph = CSRGraph(indptr, dst[order].astype(np.int32), blob, name_offsets)
+    graph._index = {name: i for i, name in enumerate(names)}
+    return graph
+
+
+def save_snapshot(graph: CSRGraph, directory) -> Path:
+    """Write the CSR arrays as .npy files."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    arrays = (graph.indptr, graph.indices, graph._names, graph._name_offsets)
+    for filename, array in zip(SNAPSHOT_FILES, arrays):
+        np.save(directory / filename, np.asarray(array))
+    return directory
+
+
+def open_snapshot(directory) -> CSRGraph:
+    """Reopen a snapshot through np.memmap without parsing anything."""
+    directory = Path(directory)
+    arrays = [np.load(directory / filename, mmap_mode="r") for filename in SNAPSHOT_FILES]
+    return CSRGraph(*arrays)
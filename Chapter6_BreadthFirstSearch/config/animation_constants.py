@@ -19,11 +19,13 @@ CONTENT_BOT = -2.0
 # Node dimensions
 NODE_RADIUS = 0.4
 NODE_SPACING = 1.8
+NODE_LABEL_ZOOM_WIDTH = 8.0   # Labels drawn only when frame is narrower
 
 # Queue visualization
 QUEUE_CARD_WIDTH = 1.2
 QUEUE_CARD_HEIGHT = 0.5
 QUEUE_SPACING = 0.1
+QUEUE_WINDOW = 6              # Cards drawn by VirtualQueueView
 
 # Edge properties
 EDGE_WIDTH = 3
@@ -1,2 +1,5 @@
 """Core visual components package."""
-from .graph_view import GraphNodeView, GraphEdgeView, QueueCardView, QueueView
+from .graph_view import (
+    GraphNodeView, GraphEdgeView, BatchedEdgeView, GraphLODView,
+    QueueCardView, QueueView, VirtualQueueView
+)
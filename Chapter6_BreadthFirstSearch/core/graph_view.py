@@ -3,6 +3,7 @@ Graph visualization components for BFS.
 """
 from manim import *
 import sys
+from collections import deque
 sys.path.insert(0, '/home/hg/Desktop/algorthims/Chapter6_BreadthFirstSearch')
 
 from config.colors import (
@@ -10,6 +11,10 @@ from config.colors import (
     EDGE_DEFAULT, EDGE_ACTIVE, EDGE_PATH, TEXT_PRIMARY
 )
 from config.fonts import NODE_LABEL_SIZE, DEGREE_LABEL_SIZE
+from config.animation_constants import (
+    EDGE_WIDTH, EDGE_ACTIVE_WIDTH, EDGE_PATH_WIDTH, NODE_RADIUS, NODE_LABEL_ZOOM_WIDTH,
+    QUEUE_CARD_WIDTH, QUEUE_CARD_HEIGHT, QUEUE_SPACING, QUEUE_WINDOW
+)
 
 
 class GraphNodeView(VGroup):
@@ -93,6 +98,207 @@ class GraphEdgeView(VGroup):
         self.line.set_stroke(width=6)
 
 
+def segment_points(starts, ends):
+    """Straight cubic Bezier control points for many segments at once."""
+    t = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+    return (starts[:, None, :] + (ends - starts)[:, None, :] * t).reshape(-1, 3)
+
+
+def circle_points(centers, radius):
+    """Four-arc cubic Bezier circles around many centres at once."""
+    kappa = 0.5523
+    angles = np.arange(4) * np.pi / 2
+    cos, sin = np.cos(angles), np.sin(angles)
+    cos_next, sin_next = np.roll(cos, -1), np.roll(sin, -1)
+    template = np.stack([
+        np.stack([cos, sin], axis=1),
+        np.stack([cos - kappa * sin, sin + kappa * cos], axis=1),
+        np.stack([cos_next + kappa * sin_next, sin_next - kappa * cos_next], axis=1),
+        np.stack([cos_next, sin_next], axis=1),
+    ], axis=1).reshape(-1, 2)
+    template = np.hstack([template, np.zeros((len(template), 1))]) * radius
+    return (centers[:, None, :] + template[None, :, :]).reshape(-1, 3)
+
+
+class BatchedEdgeView(VGroup):
+    """
+    Large-graph edge mode: every edge in a colour state shares one VMobject,
+    so a few thousand edges cost a handful of mobjects instead of thousands.
+    """
+
+    STATES = ("default", "active", "path")
+
+    def __init__(self, positions, edges, directed=True, buff=0.45, tip_length=0.15):
+        super().__init__()
+        self.directed = directed
+        self.tip_length = tip_length
+        self.edge_index = {edge: i for i, edge in enumerate(edges)}
+
+        starts = np.array([positions[u] for u, _ in edges], dtype=float).reshape(-1, 3)
+        ends = np.array([positions[v] for _, v in edges], dtype=float).reshape(-1, 3)
+        direction = ends - starts
+        length = np.linalg.norm(direction, axis=1, keepdims=True)
+        self.unit = direction / np.maximum(length, 1e-9)
+        # Trim by the node radius at both ends, like Arrow(buff=...)
+        trim = np.minimum(buff, length / 2)
+        self.starts = starts + self.unit * trim
+        self.ends = ends - self.unit * trim
+
+        self.states = np.zeros(len(edges), dtype=np.int8)
+        styles = {
+            "default": (EDGE_DEFAULT, EDGE_WIDTH),
+            "active": (EDGE_ACTIVE, EDGE_ACTIVE_WIDTH),
+            "path": (EDGE_PATH, EDGE_PATH_WIDTH),
+        }
+        self.lines = []
+        self.tips = []
+        for state in self.STATES:
+            color, width = styles[state]
+            line = VMobject(stroke_color=color, stroke_width=width, fill_opacity=0)
+            tip = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            self.lines.append(line)
+            self.tips.append(tip)
+            self.add(line, tip)
+
+        self._refresh(range(len(self.STATES)))
+
+    def _tip_points(self, idx):
+        """Closed triangles at each edge end, three segments per tip."""
+        apex = self.ends[idx]
+        base = apex - self.unit[idx] * self.tip_length
+        normal = np.stack([-self.unit[idx, 1], self.unit[idx, 0], np.zeros(len(idx))], axis=1)
+        left = base + normal * self.tip_length * 0.5
+        right = base - normal * self.tip_length * 0.5
+        starts = np.stack([apex, left, right], axis=1).reshape(-1, 3)
+        ends = np.stack([left, right, apex], axis=1).reshape(-1, 3)
+        return segment_points(starts, ends)
+
+    def _refresh(self, layers):
+        for layer in layers:
+            idx = np.flatnonzero(self.states == layer)
+            self.lines[layer].set_points(segment_points(self.starts[idx], self.ends[idx]))
+            if self.directed:
+                self.tips[layer].set_points(self._tip_points(idx))
+
+    def set_state(self, edges, state):
+        """Move one (start, end) edge or a list of them into a colour state."""
+        if isinstance(edges, tuple):
+            edges = [edges]
+        idx = np.array([self.edge_index[e] for e in edges], dtype=np.int64)
+        layer = self.STATES.index(state)
+        dirty = set(np.unique(self.states[idx]).tolist()) | {layer}
+        self.states[idx] = layer
+        self._refresh(dirty)
+        return self
+
+    def get_state(self, start, end):
+        return self.STATES[self.states[self.edge_index[(start, end)]]]
+
+    def set_active(self, start, end):
+        return self.set_state((start, end), "active")
+
+    def set_path(self, start, end):
+        return self.set_state((start, end), "path")
+
+
+class GraphLODView(VGroup):
+    """
+    Camera-aware node layer for big graphs.
+    Off-screen nodes are skipped, zoomed-out nodes are batched plain dots,
+    and full GraphNodeViews (with Text labels) are only built when zoomed in.
+    """
+
+    STATE_COLORS = {
+        "default": NODE_DEFAULT,
+        "queued": NODE_QUEUED,
+        "active": NODE_ACTIVE,
+        "visited": NODE_VISITED,
+        "target": NODE_TARGET,
+    }
+    STATES = tuple(STATE_COLORS)
+
+    def __init__(self, positions, radius=NODE_RADIUS, dot_radius=0.08,
+                 label_zoom_width=NODE_LABEL_ZOOM_WIDTH):
+        super().__init__()
+        self.names = list(positions)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.points_xy = np.array([positions[n] for n in self.names], dtype=float).reshape(-1, 3)
+        self.radius = radius
+        self.dot_radius = dot_radius
+        self.label_zoom_width = label_zoom_width
+        self.states = np.zeros(len(self.names), dtype=np.int8)   # Index into STATES
+        self._views = {}
+        self.dot_layers = [
+            VMobject(fill_color=color, fill_opacity=0.9, stroke_width=0)
+            for color in self.STATE_COLORS.values()
+        ]
+        self.visible = np.zeros(len(self.names), dtype=bool)
+        self.detailed = False
+        self._frame_key = None
+        self._dirty = set()   # Dot layers to rebuild on the next update_lod
+
+    def node_view(self, name):
+        """Full node view, built on first use and kept in sync with state."""
+        view = self._views.get(name)
+        if view is None:
+            view = GraphNodeView(name, radius=self.radius)
+            view.move_to(self.points_xy[self.index[name]])
+            view.set_state(self.STATES[self.states[self.index[name]]])
+            self._views[name] = view
+        return view
+
+    def set_state(self, name, state):
+        """
+        Recolour one node. Dots are only marked dirty here and redrawn by
+        the next update_lod (every frame once attached), so a burst of
+        state changes costs one rebuild.
+        """
+        i = self.index[name]
+        code = self.STATES.index(state)
+        if self.visible[i]:
+            self._dirty.update((int(self.states[i]), code))
+        self.states[i] = code
+        if name in self._views:
+            self._views[name].set_state(state)
+        return self
+
+    def get_state(self, name):
+        return self.STATES[self.states[self.index[name]]]
+
+    def _refresh_dots(self, layers):
+        for code in layers:
+            mask = self.visible & (self.states == code)
+            self.dot_layers[code].set_points(circle_points(self.points_xy[mask], self.dot_radius))
+
+    def update_lod(self, frame):
+        """
+        Rebuild the visible set for a camera frame (e.g. self.camera.frame).
+        An unmoved frame only redraws the dot layers set_state marked dirty.
+        """
+        center = frame.get_center()
+        key = (float(center[0]), float(center[1]), float(frame.width), float(frame.height))
+        if key != self._frame_key:
+            self._frame_key = key
+            half = np.array([frame.width / 2, frame.height / 2]) + self.radius
+            self.visible = np.all(np.abs(self.points_xy[:, :2] - center[:2]) <= half, axis=1)
+            self.detailed = frame.width <= self.label_zoom_width
+            if self.detailed:
+                self.submobjects = [self.node_view(self.names[i]) for i in np.flatnonzero(self.visible)]
+            else:
+                self._dirty = set(range(len(self.STATES)))
+                self.submobjects = list(self.dot_layers)
+        if self._dirty and not self.detailed:
+            self._refresh_dots(self._dirty)
+        self._dirty = set()
+        return self
+
+    def attach(self, frame):
+        """Follow the camera frame on every rendered frame."""
+        self.update_lod(frame)
+        self.add_updater(lambda m: m.update_lod(frame))
+        return self
+
+
 class QueueCardView(VGroup):
     """Card in the search queue."""
     
@@ -157,3 +363,84 @@ class QueueView(VGroup):
                     c.next_to(self.cards[i-1], DOWN, buff=0.1)
             return card
         return None
+
+
+class VirtualQueueView(VGroup):
+    """
+    BFS queue for long frontiers: only the first `window` entries get a card,
+    cards are recycled from a fixed pool, and the rest collapse into "+N more".
+    """
+
+    def __init__(self, position=None, window=QUEUE_WINDOW):
+        super().__init__()
+        self.items = deque()
+        self.window = window
+        self.pool = []
+        self.position = position if position is not None else RIGHT * 4 + UP * 1
+        step = QUEUE_CARD_HEIGHT + QUEUE_SPACING
+        self.slots = [self.position + DOWN * step * i for i in range(window)]
+
+        self.container_label = Text("Queue", font_size=NODE_LABEL_SIZE, color=TEXT_PRIMARY)
+        self.container_label.move_to(self.position + UP * 1)
+        self.add(self.container_label)
+
+        self.more_label = None
+        self.hidden_count = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def _set_label(self, card, label):
+        card.remove(card.label)
+        card.label = Text(label, font_size=NODE_LABEL_SIZE, color=TEXT_PRIMARY)
+        card.label.move_to(card.rect.get_center())
+        card.add(card.label)
+
+    def _update_counter(self):
+        hidden = max(len(self.items) - self.window, 0)
+        if hidden == self.hidden_count:
+            return
+        self.hidden_count = hidden
+        if self.more_label is not None:
+            self.remove(self.more_label)
+            self.more_label = None
+        if hidden:
+            self.more_label = Text(f"+{hidden} more", font_size=DEGREE_LABEL_SIZE, color=TEXT_PRIMARY)
+            self.more_label.next_to(self.slots[-1], DOWN, buff=QUEUE_CARD_HEIGHT)
+            self.add(self.more_label)
+
+    def enqueue(self, label):
+        """Add to back of queue; returns the card, or None if it is off-window."""
+        self.items.append(label)
+        slot = len(self.items) - 1
+        card = None
+        if slot < self.window:
+            if slot < len(self.pool):
+                card = self.pool[slot]
+                self._set_label(card, label)
+            else:
+                card = QueueCardView(label, width=QUEUE_CARD_WIDTH, height=QUEUE_CARD_HEIGHT)
+                self.pool.append(card)
+            card.move_to(self.slots[slot])
+            self.add(card)
+        self._update_counter()
+        return card
+
+    def dequeue(self):
+        """Remove from front; the freed card is recycled at the back of the window."""
+        if not self.items:
+            return None
+        label = self.items.popleft()
+
+        front = self.pool.pop(0)
+        self.pool.append(front)
+        visible = min(len(self.items), self.window)
+        for i, card in enumerate(self.pool[:visible]):
+            card.move_to(self.slots[i])
+        if len(self.items) >= self.window:
+            self._set_label(front, self.items[self.window - 1])
+        else:
+            self.remove(front)
+
+        self._update_counter()
+        return label
@@ -3,3 +3,4 @@ from .logic import (
     dijkstra_steps, DijkstraState, get_path,
     SIMPLE_GRAPH, TRADING_GRAPH, NEGATIVE_GRAPH, DIJKSTRA_COMPLEXITY
 )
+from .loader import CSRGraph, load_edge_list, save_snapshot, open_snapshot
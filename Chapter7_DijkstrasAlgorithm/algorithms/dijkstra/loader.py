@@ -0,0 +1,187 @@
+"""
+Streaming weighted edge-list loader with memory-mapped CSR snapshots.
+No Manim imports.
+"""
+from typing import Dict, Iterator, List, Optional
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+
+SNAPSHOT_FILES = ("indptr.npy", "indices.npy", "weights.npy", "names.npy", "name_offsets.npy")
+
+
+class CSRGraph(Mapping):
+    """
+    Read-only weighted adjacency list backed by CSR arrays.
+    Behaves like {node: {neighbor: weight}} so dijkstra_steps can take it directly.
+    """
+
+    def __init__(self, indptr, indices, weights, names, name_offsets):
+        self.indptr = indptr              # int64, one entry per node + 1
+        self.indices = indices            # int32 neighbor ids
+        self.weights = weights            # int64 or float64, aligned with indices
+        self._names = names               # uint8 UTF-8 blob of all node names
+        self._name_offsets = name_offsets  # int64, one entry per node + 1
+        self._index: Optional[Dict[str, int]] = None
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    @property
+    def nodes(self) -> List[str]:
+        return [self.name(i) for i in range(self.num_nodes)]
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Name -> id, built on first use so opening a snapshot stays cheap."""
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self)}
+        return self._index
+
+    def name(self, i: int) -> str:
+        start, end = self._name_offsets[i], self._name_offsets[i + 1]
+        return bytes(self._names[start:end]).decode("utf-8")
+
+    def __getitem__(self, node: str) -> Dict[str, float]:
+        i = self.index[node]
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        return {
+            self.name(j): w.item()
+            for j, w in zip(self.indices[lo:hi], self.weights[lo:hi])
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.num_nodes):
+            yield self.name(i)
+
+    def __len__(self) -> int:
+        return self.num_nodes
+
+    def __contains__(self, node) -> bool:
+        return node in self.index
+
+
+def load_edge_list(
+    path,
+    delimiter: Optional[str] = None,
+    directed: bool = True,
+    skip_header: bool = False,
+    default_weight: float = 1,
+    chunk_size: int = 100_000
+) -> CSRGraph:
+    """
+    Stream a weighted edge list ("src dst [weight]" per line) into a CSRGraph.
+
+    Args:
+        path: Text file, whitespace separated or CSV
+        delimiter: Field separator (None = auto-detect comma, else whitespace)
+        directed: If False, every edge is added in both directions
+        skip_header: Ignore the first non-comment line
+        default_weight: Weight used when a line has no third column
+        chunk_size: Edges buffered before flushing to a NumPy chunk
+
+    Returns:
+        CSRGraph with nodes numbered in first-seen order
+    """
+    index: Dict[str, int] = {}
+    names: List[str] = []
+    src_chunks, dst_chunks, weight_chunks = [], [], []
+    src_buf, dst_buf, weight_buf = [], [], []
+
+    def intern(name: str) -> int:
+        i = index.get(name)
+        if i is None:
+            i = index[name] = len(names)
+            names.append(name)
+        return i
+
+    def flush():
+        if src_buf:
+            src_chunks.append(np.array(src_buf, dtype=np.int32))
+            dst_chunks.append(np.array(dst_buf, dtype=np.int32))
+            weight_chunks.append(np.array(weight_buf, dtype=np.float64))
+            src_buf.clear()
+            dst_buf.clear()
+            weight_buf.clear()
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if delimiter is None:
+                delimiter = "," if "," in line else ""
+            if skip_header:
+                skip_header = False
+                continue
+
+            fields = [p.strip() for p in line.split(delimiter or None)]
+            if len(fields) < 2:
+                raise ValueError(f"Malformed edge line: {line!r}")
+            u, v = intern(fields[0]), intern(fields[1])
+            w = float(fields[2]) if len(fields) > 2 and fields[2] else default_weight
+            src_buf.append(u)
+            dst_buf.append(v)
+            weight_buf.append(w)
+            if not directed:
+                src_buf.append(v)
+                dst_buf.append(u)
+                weight_buf.append(w)
+            if len(src_buf) >= chunk_size:
+                flush()
+    flush()
+
+    if src_chunks:
+        src = np.concatenate(src_chunks)
+        dst = np.concatenate(dst_chunks)
+        weights = np.concatenate(weight_chunks)
+    else:
+        src = dst = np.empty(0, dtype=np.int32)
+        weights = np.empty(0, dtype=np.float64)
+    return _from_edges(names, src, dst, weights)
+
+
+def _from_edges(names: List[str], src: np.ndarray, dst: np.ndarray,
+                weights: np.ndarray) -> CSRGraph:
+    """Group edges by source (stable, so file order is kept per node)."""
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=len(names)), out=indptr[1:])
+
+    # Keep integer weights integral so cost labels read "6", not "6.0"
+    weights = weights[order]
+    if np.all(weights == np.round(weights)):
+        weights = weights.astype(np.int64)
+
+    encoded = [n.encode("utf-8") for n in names]
+    name_offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=name_offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    graph = CSRGraph(indptr, dst[order].astype(np.int32), weights, blob, name_offsets)
+    graph._index = {name: i for i, name in enumerate(names)}
+    return graph
+
+
+def save_snapshot(graph: CSRGraph, directory) -> Path:
+    """Write the CSR arrays as .npy files."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    arrays = (graph.indptr, graph.indices, graph.weights, graph._names, graph._name_offsets)
+    for filename, array in zip(SNAPSHOT_FILES, arrays):
+        np.save(directory / filename, np.asarray(array))
+    return directory
+
+
+def open_snapshot(directory) -> CSRGraph:
+    """Reopen a snapshot through np.memmap without parsing anything."""
+    directory = Path(directory)
+    arrays = [np.load(directory / filename, mmap_mode="r") for filename in SNAPSHOT_FILES]
+    return CSRGraph(*arrays)
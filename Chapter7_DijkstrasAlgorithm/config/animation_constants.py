@@ -28,3 +28,7 @@ TABLE_ROW_HEIGHT = 0.5
 EDGE_WIDTH = 4
 EDGE_ACTIVE_WIDTH = 6
 EDGE_PATH_WIDTH = 8
+
+# Large-graph rendering
+EDGE_LABEL_ZOOM_WIDTH = 6.0   # Weights drawn only when frame is narrower
+NODE_LABEL_ZOOM_WIDTH = 8.0   # Node labels drawn only when frame is narrower
@@ -1,5 +1,5 @@
 """Core visual components package."""
 from .weighted_graph_view import (
-    WeightedNodeView, WeightedEdgeView,
-    CostTableView, ParentTableView, ProcessedSetView
+    WeightedNodeView, WeightedEdgeView, BatchedWeightedEdgeView, WeightedGraphLODView,
+    CostTableView, ParentTableView, GlyphCache, DijkstraTableView, ProcessedSetView
 )
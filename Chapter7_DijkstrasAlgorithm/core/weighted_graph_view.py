@@ -7,10 +7,14 @@ sys.path.insert(0, '/home/hg/Desktop/algorthims/Chapter7_DijkstrasAlgorithm')
 
 from config.colors import (
     NODE_DEFAULT, NODE_PROCESSING, NODE_PROCESSED, NODE_CHEAPEST,
-    NODE_START, NODE_FINISH, EDGE_DEFAULT, EDGE_PATH, TEXT_PRIMARY,
+    NODE_START, NODE_FINISH, EDGE_DEFAULT, EDGE_CONSIDERING, EDGE_PATH, TEXT_PRIMARY,
     COST_TABLE, PARENT_TABLE, PROCESSED_SET
 )
 from config.fonts import NODE_LABEL_SIZE, WEIGHT_LABEL_SIZE, TINY_SIZE
+from config.animation_constants import (
+    EDGE_WIDTH, EDGE_ACTIVE_WIDTH, EDGE_PATH_WIDTH, EDGE_LABEL_ZOOM_WIDTH,
+    NODE_RADIUS, NODE_LABEL_ZOOM_WIDTH, FAST
+)
 
 
 class WeightedNodeView(VGroup):
@@ -89,6 +93,235 @@ class WeightedEdgeView(VGroup):
         self.add(self.line, self.weight_badge)
 
 
+def segment_points(starts, ends):
+    """Straight cubic Bezier control points for many segments at once."""
+    t = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+    return (starts[:, None, :] + (ends - starts)[:, None, :] * t).reshape(-1, 3)
+
+
+def circle_points(centers, radius):
+    """Four-arc cubic Bezier circles around many centres at once."""
+    kappa = 0.5523
+    angles = np.arange(4) * np.pi / 2
+    cos, sin = np.cos(angles), np.sin(angles)
+    cos_next, sin_next = np.roll(cos, -1), np.roll(sin, -1)
+    template = np.stack([
+        np.stack([cos, sin], axis=1),
+        np.stack([cos - kappa * sin, sin + kappa * cos], axis=1),
+        np.stack([cos_next + kappa * sin_next, sin_next - kappa * cos_next], axis=1),
+        np.stack([cos_next, sin_next], axis=1),
+    ], axis=1).reshape(-1, 2)
+    template = np.hstack([template, np.zeros((len(template), 1))]) * radius
+    return (centers[:, None, :] + template[None, :, :]).reshape(-1, 3)
+
+
+class BatchedWeightedEdgeView(VGroup):
+    """
+    Large-graph edge mode: every edge in a colour state shares one VMobject,
+    and weight badges are only built for visible edges when zoomed in.
+    """
+
+    STATES = ("default", "considering", "path")
+
+    def __init__(self, positions, edges, directed=True, buff=0.5, tip_length=0.18,
+                 label_zoom_width=EDGE_LABEL_ZOOM_WIDTH):
+        """edges: (start, end, weight) triples."""
+        super().__init__()
+        self.directed = directed
+        self.tip_length = tip_length
+        self.label_zoom_width = label_zoom_width
+        self.edge_index = {(u, v): i for i, (u, v, _) in enumerate(edges)}
+        self.weights = [w for _, _, w in edges]
+
+        starts = np.array([positions[u] for u, _, _ in edges], dtype=float).reshape(-1, 3)
+        ends = np.array([positions[v] for _, v, _ in edges], dtype=float).reshape(-1, 3)
+        self.midpoints = (starts + ends) / 2
+        direction = ends - starts
+        length = np.linalg.norm(direction, axis=1, keepdims=True)
+        self.unit = direction / np.maximum(length, 1e-9)
+        # Trim by the node radius at both ends, like Arrow(buff=...)
+        trim = np.minimum(buff, length / 2)
+        self.starts = starts + self.unit * trim
+        self.ends = ends - self.unit * trim
+
+        self.states = np.zeros(len(edges), dtype=np.int8)
+        styles = {
+            "default": (EDGE_DEFAULT, EDGE_WIDTH),
+            "considering": (EDGE_CONSIDERING, EDGE_ACTIVE_WIDTH),
+            "path": (EDGE_PATH, EDGE_PATH_WIDTH),
+        }
+        self.lines = []
+        self.tips = []
+        for state in self.STATES:
+            color, width = styles[state]
+            line = VMobject(stroke_color=color, stroke_width=width, fill_opacity=0)
+            tip = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            self.lines.append(line)
+            self.tips.append(tip)
+            self.add(line, tip)
+
+        self.labels = VGroup()
+        self._label_cache = {}
+        self.add(self.labels)
+
+        self._refresh(range(len(self.STATES)))
+
+    def _tip_points(self, idx):
+        """Closed triangles at each edge end, three segments per tip."""
+        apex = self.ends[idx]
+        base = apex - self.unit[idx] * self.tip_length
+        normal = np.stack([-self.unit[idx, 1], self.unit[idx, 0], np.zeros(len(idx))], axis=1)
+        left = base + normal * self.tip_length * 0.5
+        right = base - normal * self.tip_length * 0.5
+        starts = np.stack([apex, left, right], axis=1).reshape(-1, 3)
+        ends = np.stack([left, right, apex], axis=1).reshape(-1, 3)
+        return segment_points(starts, ends)
+
+    def _refresh(self, layers):
+        for layer in layers:
+            idx = np.flatnonzero(self.states == layer)
+            self.lines[layer].set_points(segment_points(self.starts[idx], self.ends[idx]))
+            if self.directed:
+                self.tips[layer].set_points(self._tip_points(idx))
+
+    def set_state(self, edges, state):
+        """Move one (start, end) edge or a list of them into a colour state."""
+        if isinstance(edges, tuple):
+            edges = [edges]
+        idx = np.array([self.edge_index[e] for e in edges], dtype=np.int64)
+        layer = self.STATES.index(state)
+        dirty = set(np.unique(self.states[idx]).tolist()) | {layer}
+        self.states[idx] = layer
+        self._refresh(dirty)
+        return self
+
+    def get_state(self, start, end):
+        return self.STATES[self.states[self.edge_index[(start, end)]]]
+
+    def _badge(self, i):
+        if i not in self._label_cache:
+            badge_bg = Circle(radius=0.2, fill_color=BACKGROUND_COLOR, fill_opacity=0.9,
+                              stroke_color=EDGE_DEFAULT, stroke_width=2)
+            badge_text = Text(str(self.weights[i]), font_size=WEIGHT_LABEL_SIZE, color=TEXT_PRIMARY)
+            badge = VGroup(badge_bg, badge_text)
+            badge.move_to(self.midpoints[i])
+            self._label_cache[i] = badge
+        return self._label_cache[i]
+
+    def update_labels(self, frame):
+        """
+        Show weight badges only when `frame` (a camera frame) is zoomed in,
+        and only for edges whose midpoint is on screen.
+        """
+        if frame.width > self.label_zoom_width:
+            self.labels.submobjects = []
+            return self
+        center = frame.get_center()
+        half = np.array([frame.width / 2, frame.height / 2])
+        inside = np.all(np.abs(self.midpoints[:, :2] - center[:2]) <= half, axis=1)
+        self.labels.submobjects = [self._badge(i) for i in np.flatnonzero(inside)]
+        return self
+
+
+class WeightedGraphLODView(VGroup):
+    """
+    Camera-aware node layer for big graphs.
+    Off-screen nodes are skipped, zoomed-out nodes are batched plain dots,
+    and full WeightedNodeViews (with Text labels) are only built when zoomed in.
+    """
+
+    STATE_COLORS = {
+        "default": NODE_DEFAULT,
+        "cheapest": NODE_CHEAPEST,
+        "processing": NODE_PROCESSING,
+        "processed": NODE_PROCESSED,
+        "start": NODE_START,
+        "finish": NODE_FINISH,
+    }
+    STATES = tuple(STATE_COLORS)
+
+    def __init__(self, positions, radius=NODE_RADIUS, dot_radius=0.08,
+                 label_zoom_width=NODE_LABEL_ZOOM_WIDTH):
+        super().__init__()
+        self.names = list(positions)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.points_xy = np.array([positions[n] for n in self.names], dtype=float).reshape(-1, 3)
+        self.radius = radius
+        self.dot_radius = dot_radius
+        self.label_zoom_width = label_zoom_width
+        self.states = np.zeros(len(self.names), dtype=np.int8)   # Index into STATES
+        self._views = {}
+        self.dot_layers = [
+            VMobject(fill_color=color, fill_opacity=0.9, stroke_width=0)
+            for color in self.STATE_COLORS.values()
+        ]
+        self.visible = np.zeros(len(self.names), dtype=bool)
+        self.detailed = False
+        self._frame_key = None
+        self._dirty = set()   # Dot layers to rebuild on the next update_lod
+
+    def node_view(self, name):
+        """Full node view, built on first use and kept in sync with state."""
+        view = self._views.get(name)
+        if view is None:
+            view = WeightedNodeView(name, radius=self.radius)
+            view.move_to(self.points_xy[self.index[name]])
+            view.set_state(self.STATES[self.states[self.index[name]]])
+            self._views[name] = view
+        return view
+
+    def set_state(self, name, state):
+        """
+        Recolour one node. Dots are only marked dirty here and redrawn by
+        the next update_lod (every frame once attached), so a burst of
+        state changes costs one rebuild.
+        """
+        i = self.index[name]
+        code = self.STATES.index(state)
+        if self.visible[i]:
+            self._dirty.update((int(self.states[i]), code))
+        self.states[i] = code
+        if name in self._views:
+            self._views[name].set_state(state)
+        return self
+
+    def get_state(self, name):
+        return self.STATES[self.states[self.index[name]]]
+
+    def _refresh_dots(self, layers):
+        for code in layers:
+            mask = self.visible & (self.states == code)
+            self.dot_layers[code].set_points(circle_points(self.points_xy[mask], self.dot_radius))
+
+    def update_lod(self, frame):
+        """
+        Rebuild the visible set for a camera frame (e.g. self.camera.frame).
+        An unmoved frame only redraws the dot layers set_state marked dirty.
+        """
+        center = frame.get_center()
+        key = (float(center[0]), float(center[1]), float(frame.width), float(frame.height))
+        if key != self._frame_key:
+            self._frame_key = key
+            half = np.array([frame.width / 2, frame.height / 2]) + self.radius
+            self.visible = np.all(np.abs(self.points_xy[:, :2] - center[:2]) <= half, axis=1)
+            self.detailed = frame.width <= self.label_zoom_width
+            if self.detailed:
+                self.submobjects = [self.node_view(self.names[i]) for i in np.flatnonzero(self.visible)]
+            else:
+                self._dirty = set(range(len(self.STATES)))
+                self.submobjects = list(self.dot_layers)
+        if self._dirty and not self.detailed:
+            self._refresh_dots(self._dirty)
+        self._dirty = set()
+        return self
+
+    def attach(self, frame):
+        """Follow the camera frame on every rendered frame."""
+        self.update_lod(frame)
+        self.add_updater(lambda m: m.update_lod(frame))
+        return self
+
+
 class CostTableView(VGroup):
     """Cost tracking table for Dijkstra."""
     
@@ -167,6 +400,137 @@ class ParentTableView(VGroup):
             self.move_to(position)
 
 
+class GlyphCache:
+    """
+    Text is expensive to build, so digits and ∞ are rendered once and
+    copied; each glyph keeps its baseline offset from the template string.
+    """
+
+    CHARSET = "0123456789.-+e∞"
+
+    def __init__(self, font_size=TINY_SIZE):
+        self.font_size = font_size
+        self._glyphs = {}
+        self._words = {}
+        template = Text(self.CHARSET, font_size=font_size, color=TEXT_PRIMARY)
+        self.baseline = template[0].get_bottom()[1]
+        for char, glyph in zip(self.CHARSET, template):
+            self._glyphs[char] = glyph
+        self.gap = template[0].width * 0.15
+
+    def _glyph(self, char):
+        if char not in self._glyphs:
+            glyph = Text(char, font_size=self.font_size, color=TEXT_PRIMARY)
+            glyph.shift(UP * (self.baseline - glyph.get_bottom()[1]))
+            self._glyphs[char] = glyph
+        return self._glyphs[char]
+
+    def number(self, text, color=TEXT_PRIMARY):
+        """Compose a value such as "35" or "∞" from cached glyphs."""
+        group = VGroup()
+        x = 0.0
+        for char in text:
+            glyph = self._glyph(char).copy().set_color(color)
+            glyph.shift(RIGHT * (x - glyph.get_left()[0]))
+            x += glyph.width + self.gap
+            group.add(glyph)
+        return group
+
+    def word(self, text, color=TEXT_PRIMARY):
+        """Whole-word cache for node names (a fixed vocabulary per graph)."""
+        key = (text, color)
+        if key not in self._words:
+            self._words[key] = Text(text, font_size=self.font_size, color=color)
+        return self._words[key].copy()
+
+
+class DijkstraTableView(VGroup):
+    """
+    Cost + parent table that updates in place: every node owns a pre-laid-out
+    row, and apply_state only rebuilds the cells whose value changed.
+    """
+
+    def __init__(self, nodes, position=None, rows_per_column=12, row_height=0.32,
+                 column_width=2.6, font_size=TINY_SIZE):
+        super().__init__()
+        self.nodes = list(nodes)
+        self.glyphs = GlyphCache(font_size)
+        self.costs = {node: float('inf') for node in self.nodes}
+        self.parents = {node: None for node in self.nodes}
+        self.name_cells = {}
+        self.cost_cells = {}
+        self.parent_cells = {}
+
+        n_columns = max((len(self.nodes) + rows_per_column - 1) // rows_per_column, 1)
+        for c in range(n_columns):
+            origin = RIGHT * column_width * c
+            for title, color, dx in (("NODE", TEXT_PRIMARY, 0.0), ("COST", COST_TABLE, 0.9),
+                                     ("PARENT", PARENT_TABLE, 1.6)):
+                header = Text(title, font_size=font_size, color=color, weight=BOLD)
+                header.move_to(origin + RIGHT * dx, aligned_edge=LEFT)
+                self.add(header)
+
+        for i, node in enumerate(self.nodes):
+            column, row = divmod(i, rows_per_column)
+            origin = RIGHT * column_width * column + DOWN * row_height * (row + 1.5)
+            name = self.glyphs.word(node)
+            name.move_to(origin, aligned_edge=LEFT)
+            self.name_cells[node] = name
+            self.cost_cells[node] = self._cost_value(node, self.costs[node])
+            self.parent_cells[node] = self._parent_value(node, None)
+            self.add(name, self.cost_cells[node], self.parent_cells[node])
+
+        if position is not None:
+            self.move_to(position)
+
+    def _anchor(self, node, dx):
+        # Anchored to the row's name cell so the table can be moved freely
+        name = self.name_cells[node]
+        return np.array([name.get_left()[0] + dx, name.get_center()[1], 0.0])
+
+    def _cost_value(self, node, cost):
+        if cost == float('inf'):
+            cell = self.glyphs.number("∞", TEXT_PRIMARY)
+        else:
+            cell = self.glyphs.number(str(cost), COST_TABLE)
+        cell.move_to(self._anchor(node, 0.9), aligned_edge=LEFT)
+        return cell
+
+    def _parent_value(self, node, parent):
+        cell = self.glyphs.word(parent if parent is not None else "—")
+        cell.move_to(self._anchor(node, 1.6), aligned_edge=LEFT)
+        return cell
+
+    def dirty_cells(self, state):
+        """(kind, node) pairs whose displayed value differs from `state`."""
+        dirty = []
+        for node in self.nodes:
+            if state.costs.get(node, float('inf')) != self.costs[node]:
+                dirty.append(("cost", node))
+            if state.parents.get(node) != self.parents[node]:
+                dirty.append(("parent", node))
+        return dirty
+
+    def apply_state(self, state, run_time=FAST):
+        """
+        Bring the table in line with a DijkstraState.
+        Returns one AnimationGroup for all dirty cells, or None if nothing changed.
+        """
+        animations = []
+        for kind, node in self.dirty_cells(state):
+            if kind == "cost":
+                self.costs[node] = state.costs.get(node, float('inf'))
+                target = self._cost_value(node, self.costs[node])
+                animations.append(Transform(self.cost_cells[node], target))
+            else:
+                self.parents[node] = state.parents.get(node)
+                target = self._parent_value(node, self.parents[node])
+                animations.append(Transform(self.parent_cells[node], target))
+        if not animations:
+            return None
+        return AnimationGroup(*animations, run_time=run_time)
+
+
 class ProcessedSetView(VGroup):
     """Processed nodes display."""
     
@@ -0,0 +1,195 @@
+"""
+Force-directed node placement for generated graphs.
+Fruchterman-Reingold with a grid (one-level Barnes-Hut) approximation
+for long-range repulsion. Pure NumPy, no Manim imports.
+"""
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+import hashlib
+
+import numpy as np
+
+
+# Below this many nodes, exact O(n^2) repulsion is cheaper than gridding
+EXACT_REPULSION_LIMIT = 600
+
+# Target number of nodes per grid cell for the approximation
+NODES_PER_CELL = 8
+
+_LAYOUT_CACHE: Dict[str, Dict[str, np.ndarray]] = {}
+
+
+def _edge_list(graph) -> Tuple[List[str], np.ndarray]:
+    """Node order plus an (m, 2) array of undirected edge ids."""
+    nodes = list(graph)
+    index = {name: i for i, name in enumerate(nodes)}
+    edges = []
+    for name in nodes:
+        # Neighbors may be a list (BFS) or a {neighbor: weight} dict (Dijkstra)
+        for neighbor in graph[name]:
+            if neighbor not in index:
+                index[neighbor] = len(nodes)
+                nodes.append(neighbor)
+            if neighbor != name:
+                edges.append((index[name], index[neighbor]))
+    return nodes, np.array(edges, dtype=np.int64).reshape(-1, 2)
+
+
+def graph_fingerprint(graph, **params) -> str:
+    """Stable hash of the graph structure and layout parameters."""
+    h = hashlib.sha1()
+    for name in graph:
+        h.update(repr(name).encode())
+        h.update(repr(sorted(map(repr, graph[name]))).encode())
+    h.update(repr(sorted(params.items())).encode())
+    return h.hexdigest()
+
+
+def _scatter_add(target: np.ndarray, rows: np.ndarray, values: np.ndarray):
+    """target[rows] += values with repeated rows; bincount beats np.add.at."""
+    for axis in range(target.shape[1]):
+        target[:, axis] += np.bincount(rows, weights=values[:, axis], minlength=len(target))
+
+
+def _exact_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    delta = pos[:, None, :] - pos[None, :, :]
+    dist2 = np.maximum((delta ** 2).sum(axis=-1), 1e-6)
+    np.fill_diagonal(dist2, np.inf)
+    return (delta * (k * k / dist2)[..., None]).sum(axis=1)
+
+
+def _grid_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    """
+    Exact repulsion from nodes in the 3x3 neighborhood of each node's cell,
+    centre-of-mass repulsion between all other cells.
+    """
+    n = len(pos)
+    side = max(int(np.ceil(np.sqrt(n / NODES_PER_CELL))), 1)
+    lo = pos.min(axis=0)
+    span = np.maximum(pos.max(axis=0) - lo, 1e-9)
+    cell_xy = np.minimum(((pos - lo) / span * side).astype(np.int64), side - 1)
+    cell = cell_xy[:, 0] * side + cell_xy[:, 1]
+    n_cells = side * side
+
+    # Per-cell mass and centre of mass
+    mass = np.bincount(cell, minlength=n_cells).astype(np.float64)
+    com = np.zeros((n_cells, 2))
+    _scatter_add(com, cell, pos)
+    occupied = mass > 0
+    com[occupied] /= mass[occupied, None]
+
+    # Far field: cell-to-cell between non-adjacent cells, applied to every
+    # node of the receiving cell
+    cells = np.flatnonzero(occupied)
+    cxy = np.stack([cells // side, cells % side], axis=1)
+    far = (np.abs(cxy[:, None, :] - cxy[None, :, :]) > 1).any(axis=-1)
+    delta = com[cells][:, None, :] - com[cells][None, :, :]
+    dist2 = np.maximum((delta ** 2).sum(axis=-1), 1e-6)
+    weight = np.where(far, mass[cells][None, :] * k * k / dist2, 0.0)
+    cell_force = np.zeros((n_cells, 2))
+    cell_force[cells] = (delta * weight[..., None]).sum(axis=1)
+    force = cell_force[cell]
+
+    # Near field: exact pairs, gathered cell by cell via a sorted node order
+    order = np.argsort(cell, kind="stable")
+    starts = np.searchsorted(cell[order], np.arange(n_cells))
+    counts = mass.astype(np.int64)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nx, ny = cell_xy[:, 0] + dx, cell_xy[:, 1] + dy
+            valid = (nx >= 0) & (nx < side) & (ny >= 0) & (ny < side)
+            src = np.flatnonzero(valid)
+            other = nx[src] * side + ny[src]
+            c = counts[other]
+            total = int(c.sum())
+            if total == 0:
+                continue
+            i = np.repeat(src, c)
+            offsets = np.repeat(starts[other] - np.cumsum(c) + c, c) + np.arange(total)
+            j = order[offsets]
+            keep = i != j
+            i, j = i[keep], j[keep]
+            d = pos[i] - pos[j]
+            d2 = np.maximum((d ** 2).sum(axis=-1), 1e-6)
+            _scatter_add(force, i, d * (k * k / d2)[:, None])
+    return force
+
+
+def spring_layout(
+    graph,
+    width: float = 8.0,
+    height: float = 5.0,
+    center: Tuple[float, float] = (0.0, 0.0),
+    iterations: int = 100,
+    seed: int = 0,
+    cache_dir: Optional[str] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute node positions for an arbitrary graph.
+
+    Args:
+        graph: {node: [neighbors]} or {node: {neighbor: weight}}
+        width, height: Size of the box the layout is scaled into
+        center: Centre of that box in scene coordinates
+        iterations: Fruchterman-Reingold cooling steps
+        seed: Seed for the initial placement
+        cache_dir: Optional directory for .npy layouts reused across renders
+
+    Returns:
+        {node: np.array([x, y, 0])}, ready for Mobject.move_to; every
+        call returns fresh arrays, so callers may shift them in place
+    """
+    key = graph_fingerprint(graph, width=width, height=height, center=tuple(center),
+                            iterations=iterations, seed=seed)
+    if key in _LAYOUT_CACHE:
+        return {name: p.copy() for name, p in _LAYOUT_CACHE[key].items()}
+
+    nodes, edges = _edge_list(graph)
+    cache_file = Path(cache_dir) / f"layout_{key}.npy" if cache_dir else None
+    if cache_file is not None and cache_file.exists():
+        points = np.load(cache_file)
+    else:
+        points = _run_layout(len(nodes), edges, width, height, center, iterations, seed)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_file, points)
+
+    _LAYOUT_CACHE[key] = {name: points[i] for i, name in enumerate(nodes)}
+    return {name: points[i].copy() for i, name in enumerate(nodes)}
+
+
+def _run_layout(n, edges, width, height, center, iterations, seed) -> np.ndarray:
+    points = np.zeros((n, 3))
+    if n == 0:
+        return points
+    if n == 1:
+        points[0, :2] = center
+        return points
+
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1.0, 1.0, size=(n, 2))
+    k = np.sqrt(4.0 / n)
+    temperature = 0.2
+    repulsion = _exact_repulsion if n <= EXACT_REPULSION_LIMIT else _grid_repulsion
+
+    for step in range(iterations):
+        force = repulsion(pos, k)
+
+        if len(edges):
+            d = pos[edges[:, 0]] - pos[edges[:, 1]]
+            dist = np.maximum(np.sqrt((d ** 2).sum(axis=-1)), 1e-6)
+            pull = d * (dist / k)[:, None]
+            _scatter_add(force, edges[:, 0], -pull)
+            _scatter_add(force, edges[:, 1], pull)
+
+        # Move at most `temperature` along the net force, cooling linearly
+        length = np.maximum(np.sqrt((force ** 2).sum(axis=-1)), 1e-9)
+        pos += force * (np.minimum(length, temperature) / length)[:, None]
+        temperature = 0.2 * (1.0 - (step + 1) / iterations) + 1e-3
+
+    # Fit into the requested box, preserving aspect ratio
+    pos -= (pos.max(axis=0) + pos.min(axis=0)) / 2
+    span = np.maximum(pos.max(axis=0) - pos.min(axis=0), 1e-9)
+    pos *= min(width / span[0], height / span[1])
+    points[:, :2] = pos + np.asarray(center, dtype=np.float64)
+    return points